@@ -9,31 +9,94 @@ SRTGo GUI 실행 파일 빌드 스크립트
 """
 
 import os
+import re
 import sys
 import subprocess
 import shutil
+import hashlib
+import importlib.util
+import importlib.metadata
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import fnmatch
 from pathlib import Path
 
 
+SPEC_FILE = 'build_gui.spec'
+CACHE_KEY_FILE = Path('build/.srtgo_cache_key')
+
+# 입력이 바뀌지 않았다면 재사용할 PyInstaller 중간 결과물
+BUILD_PRESERVE = ['build/SRTGo-GUI/localpycs', 'build/SRTGo-GUI/PYZ-*.toc']
+
+# 체크아웃마다 하나인 PyInstaller 설정 디렉토리 (strip/UPX bincache 재사용)
+# srtgo 소스와 무관한 캐시이므로 정리 시 그대로 둠
+PYI_CONFIG_DIR = 'build/pyi-config'
+
+# PyInstaller는 현재 인터프리터의 모듈로 실행 (경로 탐색 불필요)
+PYI_CMD = ([sys.executable, '-m', 'PyInstaller']
+           if importlib.util.find_spec('PyInstaller') is not None else None)
+
+# PyInstaller 로그에서 실행 파일 경로를 알려주는 줄
+# (onedir 빌드에서는 build/ 아래 중간 파일을 가리키므로 dist/ 경로일 때만 사용)
+EXE_LOG_PATTERN = re.compile(r"Copying bootloader EXE to (.+)$")
+
+# 빌드 실패 시 출력할 로그 줄 수
+LOG_TAIL_LINES = 200
+
+# srtgo 의존성이 아닌 대형 패키지 (항상 제외)
+EXCLUDED_MODULES = ['pandas', 'numpy', 'scipy', 'matplotlib', 'pytest', 'IPython']
+
+# 자주 함께 번들되지만 GUI에서 거의 쓰지 않는 모듈 (import 그래프 확인 후 제외)
+EXCLUDE_CANDIDATES = [
+    'test', 'unittest', 'pydoc_data', 'tkinter.test', 'distutils', 'lib2to3',
+    'xml.dom', 'xmlrpc', 'PIL.ImageQt',
+]
+
+
+def _deps_marker():
+    """현재 인터프리터용 의존성 확인 완료 표시 파일 경로"""
+    key = hashlib.sha1(f"{sys.executable}|{sys.version}".encode()).hexdigest()
+    return Path.home() / '.cache' / 'srtgo-builder' / f'{key}.ok'
+
+
 def check_dependencies():
+    """필요한 의존성 확인 (이전에 통과했으면 생략)"""
+    marker = _deps_marker()
+    try:
+        if (PYI_CMD is not None
+                and marker.stat().st_mtime > os.stat(sys.executable).st_mtime):
+            print("✓ 의존성 확인됨 (캐시)")
+            return True
+    except OSError:
+        pass
+    
+    if not _check_dependencies():
+        return False
+    
+    try:
+        marker.parent.mkdir(parents=True, exist_ok=True)
+        marker.touch()
+    except OSError:
+        pass
+    return True
+
+
+def _check_dependencies():
     """필요한 의존성 확인"""
     try:
-        import subprocess
-        result = subprocess.run(['/home/jaegu/.local/bin/pyinstaller', '--version'], 
-                               capture_output=True, text=True)
-        if result.returncode == 0:
-            print("✓ PyInstaller 설치됨")
-        else:
+        if PYI_CMD is None:
             raise ImportError
-    except (ImportError, FileNotFoundError):
+        version = importlib.metadata.version('pyinstaller')
+        print(f"✓ PyInstaller 설치됨 ({version})")
+    except (ImportError, importlib.metadata.PackageNotFoundError):
         print("❌ PyInstaller가 설치되지 않았습니다.")
         print("다음 명령어로 설치하세요: pip install pyinstaller")
         return False
     
-    try:
-        import tkinter
+    # 모듈 본문을 실행하지 않고 위치만 확인
+    if importlib.util.find_spec('tkinter') is not None:
         print("✓ tkinter 사용 가능")
-    except ImportError:
+    else:
         print("❌ tkinter가 설치되지 않았습니다.")
         print("GUI를 위해 tkinter가 필요합니다.")
         if sys.platform.startswith('linux'):
@@ -43,9 +106,12 @@ def check_dependencies():
     
     # srtgo 모듈 확인
     try:
-        from srtgo import gui
-        print("✓ srtgo 모듈 사용 가능")
+        found = importlib.util.find_spec('srtgo.gui') is not None
     except ImportError:
+        found = False
+    if found:
+        print("✓ srtgo 모듈 사용 가능")
+    else:
         print("❌ srtgo 모듈을 찾을 수 없습니다.")
         print("현재 디렉토리에서 실행하거나 패키지를 설치하세요.")
         return False
@@ -53,57 +119,240 @@ def check_dependencies():
     return True
 
 
-def clean_build():
-    """이전 빌드 결과물 정리"""
+def _compute_cache_key():
+    """소스/spec/인터프리터 버전으로 빌드 캐시 키 계산"""
+    digest = hashlib.blake2b()
+    for path in sorted(Path('srtgo').rglob('*.py')):
+        digest.update(str(path).encode())
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(65536), b''):
+                digest.update(chunk)
+    if os.path.exists(SPEC_FILE):
+        digest.update(Path(SPEC_FILE).read_bytes())
+    digest.update(sys.version.encode())
+    return digest.hexdigest()
+
+
+def _read_cache_key():
+    """이전 빌드의 캐시 키 읽기"""
+    try:
+        return CACHE_KEY_FILE.read_text().strip()
+    except OSError:
+        return None
+
+
+def _write_cache_key(key):
+    """성공한 빌드의 캐시 키 저장"""
+    CACHE_KEY_FILE.parent.mkdir(parents=True, exist_ok=True)
+    CACHE_KEY_FILE.write_text(key)
+
+
+def _latest_source_mtime():
+    """srtgo 소스 파일 중 가장 최근 수정 시각"""
+    latest = 0.0
+    stack = ['srtgo']
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name != '__pycache__':
+                        stack.append(entry.path)
+                elif entry.name.endswith('.py'):
+                    latest = max(latest, entry.stat().st_mtime)
+    return latest
+
+
+def _is_up_to_date():
+    """실행 파일이 모든 소스와 spec 파일보다 새로운지 확인"""
+    exe_path = _find_exe()
+    if exe_path is None:
+        return False
+    try:
+        exe_mtime = os.stat(exe_path).st_mtime
+        latest = _latest_source_mtime()
+        if os.path.exists(SPEC_FILE):
+            latest = max(latest, os.stat(SPEC_FILE).st_mtime)
+    except OSError:
+        return False
+    return exe_mtime > latest
+
+
+def _prune_build(path, preserve, source_mtime, keep=False):
+    """build 트리에서 보존 대상 중 소스보다 새로운 파일만 남기고 삭제"""
+    with os.scandir(path) as it:
+        for entry in it:
+            rel = entry.path.replace(os.sep, '/')
+            if rel == PYI_CONFIG_DIR:
+                continue
+            preserved = keep or any(fnmatch(rel, pattern) for pattern in preserve)
+            if entry.is_dir(follow_symlinks=False):
+                if preserved or any(pattern.startswith(rel + '/') for pattern in preserve):
+                    _prune_build(entry.path, preserve, source_mtime, preserved)
+                else:
+                    shutil.rmtree(entry.path)
+            elif not preserved or entry.stat().st_mtime < source_mtime:
+                os.unlink(entry.path)
+
+
+def clean_build(preserve=BUILD_PRESERVE):
+    """이전 빌드 결과물 정리
+
+    build 디렉토리는 통째로 지우지 않고, preserve 패턴에 해당하면서
+    소스보다 새로운 PyInstaller 중간 결과물은 남겨 재사용합니다.
+    """
     dirs_to_clean = ['build', 'dist', '__pycache__']
-    for dir_name in dirs_to_clean:
-        if os.path.exists(dir_name):
-            print(f"🧹 {dir_name} 디렉토리 정리 중...")
-            shutil.rmtree(dir_name)
+    targets = [d for d in dirs_to_clean if os.path.exists(d)]
+    if not targets:
+        return
+    for dir_name in targets:
+        print(f"🧹 {dir_name} 디렉토리 정리 중...")
+    # 서로 독립된 디렉토리이므로 동시에 삭제
+    with ThreadPoolExecutor(max_workers=len(targets)) as executor:
+        futures = []
+        for dir_name in targets:
+            if dir_name == 'build' and preserve:
+                futures.append(executor.submit(
+                    _prune_build, dir_name, preserve, _latest_source_mtime()))
+            else:
+                futures.append(executor.submit(shutil.rmtree, dir_name))
+        for future in futures:
+            future.result()
+
+
+def _compute_excludes():
+    """번들에서 제외할 모듈 목록 계산
+
+    EXCLUDE_CANDIDATES 중 GUI가 실제로 import하지 않는 모듈만 추가합니다.
+    srtgo.gui는 srtgo.srtgo(및 srt/ktx)를 필요할 때 불러오므로 함께 import해
+    번들이 실제로 실행하는 import 그래프를 확인합니다.
+    """
+    try:
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', 'import srtgo.gui, srtgo.srtgo'],
+            capture_output=True, text=True)
+    except OSError:
+        return list(EXCLUDED_MODULES)
+    if result.returncode != 0:
+        # import 그래프를 알 수 없으면 후보 모듈은 유지
+        return list(EXCLUDED_MODULES)
+    
+    imported = set()
+    for line in result.stderr.splitlines():
+        if line.startswith('import time:') and '|' in line:
+            imported.add(line.rsplit('|', 1)[1].strip())
+    
+    return EXCLUDED_MODULES + [
+        module for module in EXCLUDE_CANDIDATES
+        if not any(name == module or name.startswith(module + '.')
+                   for name in imported)
+    ]
+
+
+def _build_env():
+    """PyInstaller 하위 프로세스 환경 구성
+
+    PYINSTALLER_CONFIG_DIR을 체크아웃 안의 고정 경로로 지정해 빌드 간에
+    bincache를 재사용하고, 네이티브 확장 컴파일은 전체 코어를 사용합니다.
+    """
+    nproc = os.cpu_count() or 2
+    return {
+        **os.environ,
+        "PYINSTALLER_CONFIG_DIR": os.path.abspath(PYI_CONFIG_DIR),
+        "MAKEFLAGS": f"-j{nproc}",
+    }
+
+
+def _find_exe():
+    """dist 폴더에서 빌드된 실행 파일 찾기 (Windows는 .exe, 그 외는 확장자 없음)
+
+    onefile 빌드는 dist/ 바로 아래, onedir 빌드는 dist/SRTGo-GUI/ 안에 있습니다.
+    """
+    for pattern in ('SRTGo-GUI*', 'SRTGo-GUI/SRTGo-GUI*'):
+        for path in Path('dist').glob(pattern):
+            if path.is_file():
+                return str(path)
+    return None
+
+
+def _is_dist_path(path):
+    """경로가 dist 폴더 안에 있는지 확인"""
+    return Path('dist').resolve() in Path(path).resolve().parents
+
+
+def _run_pyinstaller(cmd):
+    """PyInstaller 실행 후 (종료 코드, 마지막 로그, 실행 파일 경로) 반환"""
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                            text=True, bufsize=1, env=_build_env())
+    # 실패 진단용으로 마지막 로그만 보관
+    tail = deque(maxlen=LOG_TAIL_LINES)
+    exe_path = None
+    for line in proc.stdout:
+        print(line, end='')
+        tail.append(line)
+        match = EXE_LOG_PATTERN.search(line)
+        if match and _is_dist_path(match.group(1).strip()):
+            exe_path = match.group(1).strip()
+    returncode = proc.wait()
+    if returncode == 0 and exe_path is None:
+        exe_path = _find_exe()
+    return returncode, tail, exe_path
 
 
 def build_exe():
-    """PyInstaller로 실행 파일 빌드"""
+    """PyInstaller로 실행 파일 빌드
+
+    Returns:
+        (성공 여부, 실행 파일 경로)
+    """
     print("🔨 GUI 실행 파일 빌드 시작...")
     
     # PyInstaller 실행 - spec 파일 사용 시에는 spec 파일만 지정
-    cmd = [
-        '/home/jaegu/.local/bin/pyinstaller',
-        'build_gui.spec'
-    ]
+    cmd = PYI_CMD + [SPEC_FILE]
     
-    try:
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+    returncode, tail, exe_path = _run_pyinstaller(cmd)
+    
+    if returncode == 0:
         print("✅ 빌드 성공!")
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"❌ 빌드 실패: {e}")
-        print(f"에러 출력: {e.stderr}")
-        return False
+        return True, exe_path
+    
+    print(f"❌ 빌드 실패: 종료 코드 {returncode}")
+    print("에러 출력:")
+    print(''.join(tail), end='')
+    return False, None
 
 
 def create_simple_spec():
-    """간단한 spec 파일 생성 (build_gui.spec가 없는 경우)"""
+    """간단한 spec 파일 생성 (build_gui.spec가 없는 경우)
+
+    Returns:
+        (성공 여부, 실행 파일 경로)
+    """
     if not os.path.exists('build_gui.spec'):
         print("📝 간단한 spec 파일 생성...")
         
         # 간단한 PyInstaller 명령어로 대체
-        cmd = [
-            '/home/jaegu/.local/bin/pyinstaller',
+        cmd = PYI_CMD + [
             '--onefile',
             '--windowed',
             '--name=SRTGo-GUI',
-            'srtgo/gui.py'
         ]
+        # strip은 Windows에서 지원되지 않음
+        if not sys.platform.startswith('win'):
+            cmd.append('--strip')
+        upx_path = shutil.which('upx')
+        if upx_path:
+            cmd += ['--upx-dir', os.path.dirname(upx_path)]
+        for module in _compute_excludes():
+            cmd.append(f'--exclude-module={module}')
+        cmd.append('srtgo/gui.py')
         
-        try:
-            subprocess.run(cmd, check=True)
-            return True
-        except subprocess.CalledProcessError as e:
-            print(f"❌ 간단 빌드 실패: {e}")
-            return False
+        returncode, _, exe_path = _run_pyinstaller(cmd)
+        if returncode != 0:
+            print(f"❌ 간단 빌드 실패: 종료 코드 {returncode}")
+            return False, None
+        return True, exe_path
     
-    return True
+    return True, _find_exe()
 
 
 def main():
@@ -111,35 +360,50 @@ def main():
     print("🚄 SRTGo GUI 실행 파일 빌더")
     print("=" * 40)
     
+    # 마지막 빌드 이후 수정된 파일이 없으면 즉시 종료
+    if _is_up_to_date():
+        print("✓ 실행 파일이 최신 상태입니다.")
+        return
+    
     # 의존성 확인
     if not check_dependencies():
         sys.exit(1)
     
+    # 소스가 바뀌지 않았으면 빌드 생략
+    cache_key = _compute_cache_key()
+    if cache_key == _read_cache_key() and _find_exe():
+        print("✓ cache hit - 변경 사항이 없어 빌드를 건너뜁니다.")
+        return
+    
     # 이전 빌드 정리
     clean_build()
     
     # 실행 파일 빌드
-    success = False
-    
-    if os.path.exists('build_gui.spec'):
+    if os.path.exists(SPEC_FILE):
         print("📋 spec 파일을 사용하여 빌드...")
-        success = build_exe()
+        success, exe_path = build_exe()
     else:
         print("📋 spec 파일이 없습니다. 간단 빌드 시도...")
-        success = create_simple_spec()
+        success, exe_path = create_simple_spec()
     
     if success:
-        exe_path = Path('dist/SRTGo-GUI.exe')
-        if exe_path.exists():
-            size_mb = exe_path.stat().st_size / (1024 * 1024)
+        _write_cache_key(cache_key)
+        try:
+            st = os.stat(exe_path) if exe_path else None
+        except FileNotFoundError:
+            st = None
+        
+        if st is not None:
+            abs_path = os.path.abspath(exe_path)
+            size_mb = st.st_size / (1 << 20)
             print(f"🎉 빌드 완료!")
-            print(f"📁 실행 파일 위치: {exe_path.absolute()}")
+            print(f"📁 실행 파일 위치: {abs_path}")
             print(f"📏 파일 크기: {size_mb:.1f} MB")
             
             # 실행 방법 안내
             print("\n실행 방법:")
-            print(f"  - Windows: {exe_path.absolute()}")
-            print(f"  - 또는 dist 폴더의 SRTGo-GUI.exe 더블클릭")
+            print(f"  - Windows: {abs_path}")
+            print(f"  - 또는 dist 폴더의 {os.path.basename(abs_path)} 더블클릭")
             
         else:
             print("❌ 실행 파일이 생성되지 않았습니다.")
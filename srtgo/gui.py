@@ -1,23 +1,122 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 import threading
+import queue
 import keyring
 import asyncio
-# Import only necessary functions to avoid inquirer conflicts in GUI
-try:
-    from .srtgo import (
-        get_station, get_options, STATIONS, DEFAULT_STATIONS
-    )
-    # Import classes directly to avoid inquirer
-    from .srt import SRT
-    from .ktx import Korail
-except ImportError:
-    from srtgo.srtgo import (
-        get_station, get_options, STATIONS, DEFAULT_STATIONS
-    )
-    from srtgo.srt import SRT
-    from srtgo.ktx import Korail
+import functools
+
+
+def _backend():
+    # Import the CLI module on first use; it pulls in the SRT/Korail clients
+    try:
+        from . import srtgo as backend
+    except ImportError:
+        from srtgo import srtgo as backend
+    return backend
+
+
+_STYLES = {
+    'Title.TLabel': {'font': ('Arial', 16, 'bold')},
+    'Heading.TLabel': {'font': ('Arial', 12, 'bold')},
+    'Success.TLabel': {'foreground': 'green', 'font': ('Arial', 10, 'bold')},
+    'Error.TLabel': {'foreground': 'red', 'font': ('Arial', 10, 'bold')},
+}
+_STYLED_INTERP = None
+
+# Static form values shared by every window
+_HOUR_VALUES = tuple(f"{h:02d}:00" for h in range(24))
+_SEAT_TYPES = ("일반실 우선", "일반실만", "특실 우선", "특실만")
+_PASSENGER_SPEC = (
+    ("child", "어린이"),
+    ("senior", "경로우대"),
+    ("disability1to3", "중증장애인"),
+    ("disability4to6", "경증장애인"),
+)
+_OPTS = _PASSENGER_SPEC + (("ktx", "KTX만"),)
+_RESERVATION_COLUMNS = ('Status', 'Train', 'Route', 'Date', 'Time')
+
+# Event loop for reservation coroutines. It runs on its own thread so I/O
+# readiness wakes it directly instead of waiting for a Tk polling tick;
+# workers never call Tk, they hand results back through queues or futures
+# that the Tk thread polls with after().
+_LOOP = asyncio.new_event_loop()
+_LOOP_THREAD = None
+
+
+def _ensure_loop():
+    global _LOOP_THREAD
+    if _LOOP_THREAD is None:
+        _LOOP_THREAD = threading.Thread(target=_LOOP.run_forever, name="srtgo-asyncio", daemon=True)
+        _LOOP_THREAD.start()
+
+# Interval for flushing queued reservation status lines into the Text widget
+_STATUS_FLUSH_MS = 100
+
+# Interval for checking whether a background login, authentication or
+# reservation lookup has finished
+_LOGIN_POLL_MS = 100
+
+# Saved reservation defaults per rail type, read from keyring once per process
+_KEYRING_CACHE = {}
+
+
+def _load_prefs(rail_type):
+    prefs = _KEYRING_CACHE.get(rail_type)
+    if prefs is None:
+        prefs = _backend().get_prefs(rail_type)
+        _KEYRING_CACHE[rail_type] = prefs
+    return prefs
+
+
+@functools.lru_cache(maxsize=4)
+def _cached_station(rail_type):
+    return _backend().get_station(rail_type)
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_options():
+    return tuple(_backend().get_options())
+
+
+# Station keys already stored in a Tcl variable: rail_type -> (interp, keys)
+_STATION_VALUES_SET = {}
+
+
+def _station_values_var(widget, rail_type):
+    """Name of the Tcl variable holding the station list shared by comboboxes"""
+    name = f"::srtgo_keys_{rail_type}"
+    _, station_keys = _cached_station(rail_type)
+    cached = _STATION_VALUES_SET.get(rail_type)
+    if cached is None or cached[0] is not widget.tk or cached[1] is not station_keys:
+        widget.tk.call('set', name, tuple(station_keys))
+        _STATION_VALUES_SET[rail_type] = (widget.tk, station_keys)
+    return name
+
+
+# Date combobox values, rebuilt only when the day changes
+_DATE_CHOICE_CACHE = {"date": None, "values": None}
+_WD = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
+
+def _parse_yyyymmdd(s):
+    return date(int(s[:4]), int(s[4:6]), int(s[6:8]))
+
+
+def _date_display(d):
+    # "YYYYMMDD (YYYY/MM/DD Wkd)" without going through strftime/strptime
+    return f"{d.year:04d}{d.month:02d}{d.day:02d} ({d.year:04d}/{d.month:02d}/{d.day:02d} {_WD[d.weekday()]})"
+
+
+def _date_choices(now):
+    today_key = now.date()
+    if _DATE_CHOICE_CACHE["date"] != today_key:
+        _DATE_CHOICE_CACHE["date"] = today_key
+        _DATE_CHOICE_CACHE["values"] = [
+            _date_display(today_key + timedelta(days=i)) for i in range(28)
+        ]
+    return _DATE_CHOICE_CACHE["values"]
 
 
 class SRTGoGUI:
@@ -37,15 +136,22 @@ class SRTGoGUI:
         # Create main interface
         self.create_main_interface()
         
+        # Start the reservation event loop
+        _ensure_loop()
+        
     def setup_styles(self):
-        style = ttk.Style()
+        # Styles live in the Tcl interpreter; configure each interpreter once
+        global _STYLED_INTERP
+        if _STYLED_INTERP is self.root.tk:
+            return
+        
+        style = ttk.Style(self.root)
         style.theme_use('clam')
         
         # Configure colors
-        style.configure('Title.TLabel', font=('Arial', 16, 'bold'))
-        style.configure('Heading.TLabel', font=('Arial', 12, 'bold'))
-        style.configure('Success.TLabel', foreground='green', font=('Arial', 10, 'bold'))
-        style.configure('Error.TLabel', foreground='red', font=('Arial', 10, 'bold'))
+        for name, options in _STYLES.items():
+            style.configure(name, **options)
+        _STYLED_INTERP = self.root.tk
         
     def create_main_interface(self):
         # Main title
@@ -132,7 +238,11 @@ class ReservationWindow:
         self.window.geometry("600x700")
         self.window.resizable(False, False)
         
+        # Status messages are queued by workers and flushed in batches
+        self._msg_q = queue.Queue()
+        
         self.create_interface()
+        self._drain()
         
     def create_interface(self):
         # Get default values
@@ -141,37 +251,40 @@ class ReservationWindow:
         this_time = now.strftime("%H%M%S")
         
         is_srt = self.rail_type == "SRT"
+        prefs = _load_prefs(self.rail_type)
         
         defaults = {
-            "departure": keyring.get_password(self.rail_type, "departure") or ("수서" if is_srt else "서울"),
-            "arrival": keyring.get_password(self.rail_type, "arrival") or "동대구",
-            "date": keyring.get_password(self.rail_type, "date") or today,
-            "time": keyring.get_password(self.rail_type, "time") or "120000",
-            "adult": int(keyring.get_password(self.rail_type, "adult") or 1),
-            "child": int(keyring.get_password(self.rail_type, "child") or 0),
-            "senior": int(keyring.get_password(self.rail_type, "senior") or 0),
-            "disability1to3": int(keyring.get_password(self.rail_type, "disability1to3") or 0),
-            "disability4to6": int(keyring.get_password(self.rail_type, "disability4to6") or 0),
+            "departure": prefs["departure"] or ("수서" if is_srt else "서울"),
+            "arrival": prefs["arrival"] or "동대구",
+            "date": prefs["date"] or today,
+            "time": prefs["time"] or "120000",
+            "adult": int(prefs["adult"] or 1),
+            "child": int(prefs["child"] or 0),
+            "senior": int(prefs["senior"] or 0),
+            "disability1to3": int(prefs["disability1to3"] or 0),
+            "disability4to6": int(prefs["disability4to6"] or 0),
         }
         
         # Station selection
         station_frame = ttk.LabelFrame(self.window, text="역 선택", padding=10)
         station_frame.pack(fill='x', padx=10, pady=5)
         
-        stations, station_keys = get_station(self.rail_type)
+        station_values = _station_values_var(self.window, self.rail_type)
         
         ttk.Label(station_frame, text="출발역:").grid(row=0, column=0, sticky='w', padx=5)
         self.departure_var = tk.StringVar(value=defaults["departure"])
-        departure_combo = ttk.Combobox(station_frame, textvariable=self.departure_var, 
-                                     values=station_keys, width=15)
+        departure_combo = ttk.Combobox(station_frame, textvariable=self.departure_var, width=15)
         departure_combo.grid(row=0, column=1, padx=5, pady=2)
         
         ttk.Label(station_frame, text="도착역:").grid(row=0, column=2, sticky='w', padx=5)
         self.arrival_var = tk.StringVar(value=defaults["arrival"])
-        arrival_combo = ttk.Combobox(station_frame, textvariable=self.arrival_var, 
-                                   values=station_keys, width=15)
+        arrival_combo = ttk.Combobox(station_frame, textvariable=self.arrival_var, width=15)
         arrival_combo.grid(row=0, column=3, padx=5, pady=2)
         
+        # Both comboboxes read the same Tcl list instead of their own copies
+        for combo in (departure_combo, arrival_combo):
+            combo.tk.eval(f'{combo} configure -values ${station_values}')
+        
         # Date and time selection
         datetime_frame = ttk.LabelFrame(self.window, text="날짜/시간 선택", padding=10)
         datetime_frame.pack(fill='x', padx=10, pady=5)
@@ -181,16 +294,8 @@ class ReservationWindow:
         self.date_var = tk.StringVar()
         date_combo = ttk.Combobox(datetime_frame, textvariable=self.date_var, width=15)
         
-        # Generate date choices
-        date_choices = []
-        for i in range(28):
-            date_obj = now + timedelta(days=i)
-            date_str = date_obj.strftime("%Y/%m/%d %a")
-            date_val = date_obj.strftime("%Y%m%d")
-            date_choices.append(f"{date_val} ({date_str})")
-        
-        date_combo['values'] = date_choices
-        default_date_display = f"{defaults['date']} ({datetime.strptime(defaults['date'], '%Y%m%d').strftime('%Y/%m/%d %a')})"
+        date_combo['values'] = _date_choices(now)
+        default_date_display = _date_display(_parse_yyyymmdd(defaults['date']))
         self.date_var.set(default_date_display)
         date_combo.grid(row=0, column=1, padx=5, pady=2)
         
@@ -198,54 +303,36 @@ class ReservationWindow:
         ttk.Label(datetime_frame, text="출발 시각:").grid(row=1, column=0, sticky='w', padx=5)
         self.time_var = tk.StringVar(value=defaults["time"][:2])
         time_combo = ttk.Combobox(datetime_frame, textvariable=self.time_var, width=15)
-        time_combo['values'] = [f"{h:02d}:00" for h in range(24)]
+        time_combo['values'] = _HOUR_VALUES
         time_combo.grid(row=1, column=1, padx=5, pady=2)
         
         # Passenger selection
         passenger_frame = ttk.LabelFrame(self.window, text="승객 선택", padding=10)
         passenger_frame.pack(fill='x', padx=10, pady=5)
         
-        # Adult passengers (always shown)
-        ttk.Label(passenger_frame, text="성인:").grid(row=0, column=0, sticky='w', padx=5)
         self.adult_var = tk.IntVar(value=defaults["adult"])
-        adult_spin = ttk.Spinbox(passenger_frame, from_=0, to=9, textvariable=self.adult_var, width=5)
-        adult_spin.grid(row=0, column=1, padx=5, pady=2)
-        
-        # Optional passengers based on settings
-        options = get_options()
-        row = 1
-        
         self.child_var = tk.IntVar(value=defaults["child"])
         self.senior_var = tk.IntVar(value=defaults["senior"])
         self.disability1to3_var = tk.IntVar(value=defaults["disability1to3"])
         self.disability4to6_var = tk.IntVar(value=defaults["disability4to6"])
         
-        if "child" in options:
-            ttk.Label(passenger_frame, text="어린이:").grid(row=row, column=0, sticky='w', padx=5)
-            ttk.Spinbox(passenger_frame, from_=0, to=9, textvariable=self.child_var, width=5).grid(row=row, column=1, padx=5, pady=2)
-            row += 1
-            
-        if "senior" in options:
-            ttk.Label(passenger_frame, text="경로우대:").grid(row=row, column=0, sticky='w', padx=5)
-            ttk.Spinbox(passenger_frame, from_=0, to=9, textvariable=self.senior_var, width=5).grid(row=row, column=1, padx=5, pady=2)
-            row += 1
-            
-        if "disability1to3" in options:
-            ttk.Label(passenger_frame, text="중증장애인:").grid(row=row, column=0, sticky='w', padx=5)
-            ttk.Spinbox(passenger_frame, from_=0, to=9, textvariable=self.disability1to3_var, width=5).grid(row=row, column=1, padx=5, pady=2)
-            row += 1
-            
-        if "disability4to6" in options:
-            ttk.Label(passenger_frame, text="경증장애인:").grid(row=row, column=0, sticky='w', padx=5)
-            ttk.Spinbox(passenger_frame, from_=0, to=9, textvariable=self.disability4to6_var, width=5).grid(row=row, column=1, padx=5, pady=2)
+        # Adult passengers are always shown; the rest depend on settings
+        options = _cached_options()
+        rows = [("성인", self.adult_var)]
+        for key, label in _PASSENGER_SPEC:
+            if key in options:
+                rows.append((label, getattr(self, f"{key}_var")))
+        
+        for row, (label, var) in enumerate(rows):
+            ttk.Label(passenger_frame, text=f"{label}:").grid(row=row, column=0, sticky='w', padx=5)
+            ttk.Spinbox(passenger_frame, from_=0, to=9, textvariable=var, width=5).grid(row=row, column=1, padx=5, pady=2)
         
         # Seat type selection
         seat_frame = ttk.LabelFrame(self.window, text="좌석 선택", padding=10)
         seat_frame.pack(fill='x', padx=10, pady=5)
         
         self.seat_type_var = tk.StringVar(value="일반실 우선")
-        seat_types = ["일반실 우선", "일반실만", "특실 우선", "특실만"]
-        for i, seat_type in enumerate(seat_types):
+        for i, seat_type in enumerate(_SEAT_TYPES):
             ttk.Radiobutton(seat_frame, text=seat_type, variable=self.seat_type_var, 
                           value=seat_type).grid(row=i//2, column=i%2, sticky='w', padx=10, pady=2)
         
@@ -270,14 +357,20 @@ class ReservationWindow:
         scrollbar.config(command=self.status_text.yview)
         
     def start_booking(self):
+        # Snapshot the form once; each Tk variable read is a Tcl round-trip
+        departure = self.departure_var.get()
+        arrival = self.arrival_var.get()
+        adult, child, senior, disability1to3, disability4to6 = (
+            var.get() for var in (self.adult_var, self.child_var, self.senior_var,
+                                  self.disability1to3_var, self.disability4to6_var)
+        )
+        
         # Validate input
-        if self.departure_var.get() == self.arrival_var.get():
+        if departure == arrival:
             messagebox.showerror("오류", "출발역과 도착역이 같습니다.")
             return
             
-        total_passengers = (self.adult_var.get() + self.child_var.get() + 
-                          self.senior_var.get() + self.disability1to3_var.get() + 
-                          self.disability4to6_var.get())
+        total_passengers = adult + child + senior + disability1to3 + disability4to6
         
         if total_passengers == 0:
             messagebox.showerror("오류", "승객수는 0이 될 수 없습니다.")
@@ -287,49 +380,61 @@ class ReservationWindow:
             messagebox.showerror("오류", "승객수는 10명을 초과할 수 없습니다.")
             return
         
-        # Save preferences
-        keyring.set_password(self.rail_type, "departure", self.departure_var.get())
-        keyring.set_password(self.rail_type, "arrival", self.arrival_var.get())
-        
         # Extract date from combo selection
         date_val = self.date_var.get().split(' ')[0]
-        keyring.set_password(self.rail_type, "date", date_val)
         
         # Convert time
         time_val = self.time_var.get().replace(':', '') + "00"
-        keyring.set_password(self.rail_type, "time", time_val)
         
-        keyring.set_password(self.rail_type, "adult", str(self.adult_var.get()))
-        keyring.set_password(self.rail_type, "child", str(self.child_var.get()))
-        keyring.set_password(self.rail_type, "senior", str(self.senior_var.get()))
-        keyring.set_password(self.rail_type, "disability1to3", str(self.disability1to3_var.get()))
-        keyring.set_password(self.rail_type, "disability4to6", str(self.disability4to6_var.get()))
+        # Save preferences
+        prefs = {
+            "departure": departure,
+            "arrival": arrival,
+            "date": date_val,
+            "time": time_val,
+            "adult": str(adult),
+            "child": str(child),
+            "senior": str(senior),
+            "disability1to3": str(disability1to3),
+            "disability4to6": str(disability4to6),
+        }
+        _backend().set_prefs(self.rail_type, prefs)
+        _KEYRING_CACHE[self.rail_type] = prefs
         
-        # Start reservation in separate thread
+        # Start reservation on the shared event loop
         self.status_text.delete(1.0, tk.END)
         self.status_text.insert(tk.END, "예매를 시작합니다...\n")
         
-        thread = threading.Thread(target=self.run_reservation)
-        thread.daemon = True
-        thread.start()
+        asyncio.run_coroutine_threadsafe(self.run_reservation(), _LOOP)
         
-    def run_reservation(self):
+    async def run_reservation(self):
         try:
             # This would integrate with the existing reserve function
             # For now, we'll show a placeholder
             self.update_status("예매 시스템에 연결 중...")
-            # Here you would call the actual reserve function
-            # reserve(self.rail_type, self.debug)
+            # Here you would await the actual reserve function; blocking
+            # SRT/Korail calls belong in an executor, e.g.
+            # await _LOOP.run_in_executor(None, reserve, self.rail_type, self.debug)
             
         except Exception as e:
             self.update_status(f"오류 발생: {str(e)}")
             
     def update_status(self, message):
-        def update():
-            self.status_text.insert(tk.END, message + "\n")
-            self.status_text.see(tk.END)
+        self._msg_q.put(message)
         
-        self.window.after(0, update)
+    def _drain(self):
+        if not self.window.winfo_exists():
+            return
+        msgs = []
+        try:
+            while True:
+                msgs.append(self._msg_q.get_nowait())
+        except queue.Empty:
+            pass
+        if msgs:
+            self.status_text.insert(tk.END, "\n".join(msgs) + "\n")
+            self.status_text.see(tk.END)
+        self.window.after(_STATUS_FLUSH_MS, self._drain)
 
 
 class LoginSetupWindow:
@@ -366,29 +471,73 @@ class LoginSetupWindow:
         button_frame = ttk.Frame(self.window)
         button_frame.pack(pady=20)
         
-        ttk.Button(button_frame, text="저장", command=self.save_login).pack(side='left', padx=10)
+        self.save_button = ttk.Button(button_frame, text="저장", command=self.save_login)
+        self.save_button.pack(side='left', padx=10)
         ttk.Button(button_frame, text="취소", command=self.window.destroy).pack(side='left', padx=10)
         
+        self.status_var = tk.StringVar()
+        ttk.Label(self.window, textvariable=self.status_var).pack()
+        
     def save_login(self):
-        if not self.id_var.get() or not self.pass_var.get():
+        user_id = self.id_var.get()
+        password = self.pass_var.get()
+        if not user_id or not password:
             messagebox.showerror("오류", "아이디와 비밀번호를 모두 입력하세요.")
             return
+        
+        # Test login off the Tk thread so the window stays responsive; the
+        # worker only reports through the queue and never touches Tk itself
+        self.save_button.configure(state='disabled')
+        self.status_var.set("로그인 중…")
+        results = queue.Queue()
+        threading.Thread(target=self._do_login, args=(user_id, password, results), daemon=True).start()
+        self.window.after(_LOGIN_POLL_MS, self._poll_login, results)
+        
+    def _poll_login(self, results):
+        if not self.window.winfo_exists():
+            # Closed while the worker was still running
+            return
+        try:
+            error = results.get_nowait()
+        except queue.Empty:
+            self.window.after(_LOGIN_POLL_MS, self._poll_login, results)
+            return
+        if error is None:
+            self._on_login_ok()
+        else:
+            self._on_login_fail(error)
             
+    def _do_login(self, user_id, password, results):
         try:
-            # Test login - use already imported classes
-            rail = SRT if self.rail_type == "SRT" else Korail
-            test_rail = rail(self.id_var.get(), self.pass_var.get(), verbose=self.debug)
+            if self.rail_type == "SRT":
+                try:
+                    from .srt import SRT as rail
+                except ImportError:
+                    from srtgo.srt import SRT as rail
+            else:
+                try:
+                    from .ktx import Korail as rail
+                except ImportError:
+                    from srtgo.ktx import Korail as rail
+            rail(user_id, password, verbose=self.debug)
             
             # Save credentials
-            keyring.set_password(self.rail_type, "id", self.id_var.get())
-            keyring.set_password(self.rail_type, "pass", self.pass_var.get())
+            keyring.set_password(self.rail_type, "id", user_id)
+            keyring.set_password(self.rail_type, "pass", password)
             keyring.set_password(self.rail_type, "ok", "1")
-            
-            messagebox.showinfo("성공", "로그인 정보가 저장되었습니다.")
-            self.window.destroy()
-            
         except Exception as e:
-            messagebox.showerror("오류", f"로그인 실패: {str(e)}")
+            results.put(str(e))
+        else:
+            results.put(None)
+            
+    def _on_login_ok(self):
+        messagebox.showinfo("성공", "로그인 정보가 저장되었습니다.")
+        self.window.destroy()
+        
+    def _on_login_fail(self, error):
+        self.status_var.set("")
+        self.save_button.configure(state='normal')
+        messagebox.showerror("오류", f"로그인 실패: {error}")
 
 
 class KakaoSetupWindow:
@@ -428,30 +577,58 @@ class KakaoSetupWindow:
         button_frame = ttk.Frame(self.window)
         button_frame.pack(pady=10)
         
-        ttk.Button(button_frame, text="저장 및 인증", command=self.save_and_auth).pack(side='left', padx=10)
+        self.save_button = ttk.Button(button_frame, text="저장 및 인증", command=self.save_and_auth)
+        self.save_button.pack(side='left', padx=10)
         ttk.Button(button_frame, text="취소", command=self.window.destroy).pack(side='left', padx=10)
         
     def save_and_auth(self):
-        if not self.api_key_var.get():
+        api_key = self.api_key_var.get()
+        if not api_key:
             messagebox.showerror("오류", "REST API 키를 입력하세요.")
             return
-            
+        
+        # Authentication waits on the network and user input; keep it off the Tk thread
+        self.save_button.configure(state='disabled')
+        results = queue.Queue()
+        threading.Thread(target=self._do_auth, args=(api_key, results), daemon=True).start()
+        self.window.after(_LOGIN_POLL_MS, self._poll_auth, results)
+        
+    def _poll_auth(self, results):
+        if not self.window.winfo_exists():
+            # Closed while the worker was still running
+            return
+        try:
+            ok, error = results.get_nowait()
+        except queue.Empty:
+            self.window.after(_LOGIN_POLL_MS, self._poll_auth, results)
+            return
+        self._on_auth_done(ok, error)
+        
+    def _do_auth(self, api_key, results):
         try:
             # Save API key and trigger authentication process
-            keyring.set_password("kakao", "rest_api_key", self.api_key_var.get())
+            keyring.set_password("kakao", "rest_api_key", api_key)
             
             # Call the existing set_kakao function from srtgo module
             try:
                 from .srtgo import set_kakao
             except ImportError:
                 from srtgo.srtgo import set_kakao
-            if set_kakao():
-                messagebox.showinfo("성공", "카카오톡 알림 설정이 완료되었습니다!")
-                self.window.destroy()
-            else:
-                messagebox.showerror("실패", "카카오톡 인증에 실패했습니다.")
+            ok = set_kakao()
         except Exception as e:
-            messagebox.showerror("오류", f"설정 실패: {str(e)}")
+            results.put((None, str(e)))
+        else:
+            results.put((ok, None))
+            
+    def _on_auth_done(self, ok, error):
+        self.save_button.configure(state='normal')
+        if error is not None:
+            messagebox.showerror("오류", f"설정 실패: {error}")
+        elif ok:
+            messagebox.showinfo("성공", "카카오톡 알림 설정이 완료되었습니다!")
+            self.window.destroy()
+        else:
+            messagebox.showerror("실패", "카카오톡 인증에 실패했습니다.")
 
 
 class StationSetupWindow:
@@ -468,35 +645,25 @@ class StationSetupWindow:
         ttk.Label(self.window, text=f"{self.rail_type} 역 선택", 
                  style='Heading.TLabel').pack(pady=10)
         
-        # Station listbox with checkboxes
+        # Station listbox (multiple selection)
         list_frame = ttk.Frame(self.window)
         list_frame.pack(fill='both', expand=True, padx=20, pady=10)
         
         # Get current station selection
-        stations, selected_stations = get_station(self.rail_type)
-        
-        self.station_vars = {}
+        stations, selected_stations = _cached_station(self.rail_type)
+        selected_stations = frozenset(selected_stations)
+        self.stations = stations
         
-        # Create scrollable frame
-        canvas = tk.Canvas(list_frame)
-        scrollbar = ttk.Scrollbar(list_frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas)
+        self.station_list = tk.Listbox(list_frame, selectmode='extended', exportselection=False)
+        scrollbar = ttk.Scrollbar(list_frame, orient="vertical", command=self.station_list.yview)
+        self.station_list.configure(yscrollcommand=scrollbar.set)
         
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        self.station_list.insert('end', *stations)
+        for i, station in enumerate(stations):
+            if station in selected_stations:
+                self.station_list.selection_set(i)
         
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        # Add checkboxes for each station
-        for station in stations:
-            var = tk.BooleanVar(value=station in selected_stations)
-            self.station_vars[station] = var
-            ttk.Checkbutton(scrollable_frame, text=station, variable=var).pack(anchor='w', pady=2)
-        
-        canvas.pack(side="left", fill="both", expand=True)
+        self.station_list.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
         
         # Buttons
@@ -509,15 +676,13 @@ class StationSetupWindow:
         ttk.Button(button_frame, text="취소", command=self.window.destroy).pack(side='left', padx=5)
         
     def select_all(self):
-        for var in self.station_vars.values():
-            var.set(True)
+        self.station_list.selection_set(0, 'end')
             
     def deselect_all(self):
-        for var in self.station_vars.values():
-            var.set(False)
+        self.station_list.selection_clear(0, 'end')
             
     def save_stations(self):
-        selected = [station for station, var in self.station_vars.items() if var.get()]
+        selected = [self.stations[i] for i in self.station_list.curselection()]
         
         if not selected:
             messagebox.showerror("오류", "최소 하나의 역을 선택하세요.")
@@ -525,6 +690,7 @@ class StationSetupWindow:
             
         try:
             keyring.set_password(self.rail_type, "station", ",".join(selected))
+            _cached_station.cache_clear()
             messagebox.showinfo("성공", f"선택된 역: {', '.join(selected)}")
             self.window.destroy()
             
@@ -547,22 +713,11 @@ class OptionsSetupWindow:
         option_frame = ttk.Frame(self.window)
         option_frame.pack(fill='x', padx=20, pady=10)
         
-        current_options = get_options()
-        
-        self.child_var = tk.BooleanVar(value="child" in current_options)
-        ttk.Checkbutton(option_frame, text="어린이", variable=self.child_var).pack(anchor='w', pady=5)
-        
-        self.senior_var = tk.BooleanVar(value="senior" in current_options)
-        ttk.Checkbutton(option_frame, text="경로우대", variable=self.senior_var).pack(anchor='w', pady=5)
-        
-        self.disability1to3_var = tk.BooleanVar(value="disability1to3" in current_options)
-        ttk.Checkbutton(option_frame, text="중증장애인", variable=self.disability1to3_var).pack(anchor='w', pady=5)
+        current_options = frozenset(_cached_options())
         
-        self.disability4to6_var = tk.BooleanVar(value="disability4to6" in current_options)
-        ttk.Checkbutton(option_frame, text="경증장애인", variable=self.disability4to6_var).pack(anchor='w', pady=5)
-        
-        self.ktx_var = tk.BooleanVar(value="ktx" in current_options)
-        ttk.Checkbutton(option_frame, text="KTX만", variable=self.ktx_var).pack(anchor='w', pady=5)
+        self.option_vars = {key: tk.BooleanVar(value=key in current_options) for key, _ in _OPTS}
+        for key, label in _OPTS:
+            ttk.Checkbutton(option_frame, text=label, variable=self.option_vars[key]).pack(anchor='w', pady=5)
         
         # Buttons
         button_frame = ttk.Frame(self.window)
@@ -572,20 +727,11 @@ class OptionsSetupWindow:
         ttk.Button(button_frame, text="취소", command=self.window.destroy).pack(side='left', padx=10)
         
     def save_options(self):
-        options = []
-        if self.child_var.get():
-            options.append("child")
-        if self.senior_var.get():
-            options.append("senior")
-        if self.disability1to3_var.get():
-            options.append("disability1to3")
-        if self.disability4to6_var.get():
-            options.append("disability4to6")
-        if self.ktx_var.get():
-            options.append("ktx")
+        options = [key for key, _ in _OPTS if self.option_vars[key].get()]
             
         try:
             keyring.set_password("SRT", "options", ",".join(options))
+            _cached_options.cache_clear()
             messagebox.showinfo("성공", "예매 옵션이 저장되었습니다.")
             self.window.destroy()
             
@@ -602,6 +748,9 @@ class ReservationCheckWindow:
         self.window.title(f"{rail_type} 예매 확인")
         self.window.geometry("600x400")
         
+        # Tree item id for each reservation id currently shown
+        self._row_by_id = {}
+        
         self.create_interface()
         self.load_reservations()
         
@@ -614,10 +763,9 @@ class ReservationCheckWindow:
         list_frame.pack(fill='both', expand=True, padx=20, pady=10)
         
         # Treeview for reservations
-        columns = ('Status', 'Train', 'Route', 'Date', 'Time')
-        self.tree = ttk.Treeview(list_frame, columns=columns, show='headings')
+        self.tree = ttk.Treeview(list_frame, columns=_RESERVATION_COLUMNS, show='headings')
         
-        for col in columns:
+        for col in _RESERVATION_COLUMNS:
             self.tree.heading(col, text=col)
             self.tree.column(col, width=100)
         
@@ -637,18 +785,60 @@ class ReservationCheckWindow:
         ttk.Button(button_frame, text="닫기", command=self.window.destroy).pack(side='left', padx=5)
         
     def load_reservations(self):
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-            
+        future = asyncio.run_coroutine_threadsafe(self._load_async(), _LOOP)
+        self.window.after(_LOGIN_POLL_MS, self._poll_load, future)
+        
+    def _poll_load(self, future):
+        if not self.window.winfo_exists():
+            # Closed while the worker was still running
+            return
+        if not future.done():
+            self.window.after(_LOGIN_POLL_MS, self._poll_load, future)
+            return
         try:
-            # This would integrate with the existing check_reservation function
-            # For now, show placeholder data
-            self.tree.insert('', 'end', values=('예약완료', 'SRT', '수서→부산', '2024-01-01', '10:00'))
-            self.tree.insert('', 'end', values=('결제대기', 'KTX', '서울→대구', '2024-01-02', '14:30'))
-            
+            reservations = future.result()
         except Exception as e:
             messagebox.showerror("오류", f"예매 내역 조회 실패: {str(e)}")
+            return
+        self._populate(reservations)
+        
+    async def _load_async(self):
+        # Runs on the loop thread and only returns data for _poll_load to show.
+        # Every fetch runs concurrently; blocking client calls go to the executor
+        results = await asyncio.gather(
+            *(_LOOP.run_in_executor(None, fetch) for fetch in self._fetchers())
+        )
+        reservations = {}
+        for rows in results:
+            reservations.update(rows)
+        return reservations
+        
+    def _fetchers(self):
+        # This would integrate with the existing check_reservation function
+        # (reservations plus, for KTX, tickets). For now, return placeholder
+        # data keyed by reservation id
+        def placeholder():
+            return {
+                'placeholder-1': ('예약완료', 'SRT', '수서→부산', '2024-01-01', '10:00'),
+                'placeholder-2': ('결제대기', 'KTX', '서울→대구', '2024-01-02', '14:30'),
+            }
+        return [placeholder]
+        
+    def _populate(self, reservations):
+        """Apply only the rows that changed since the last refresh"""
+        # Hide columns while mutating to avoid intermediate redraws
+        self.tree.configure(displaycolumns=())
+        try:
+            for key in set(self._row_by_id) - set(reservations):
+                self.tree.delete(self._row_by_id.pop(key))
+            for key, values in reservations.items():
+                iid = self._row_by_id.get(key)
+                if iid is None:
+                    self._row_by_id[key] = self.tree.insert('', 'end', values=values)
+                elif tuple(self.tree.item(iid, 'values')) != values:
+                    self.tree.item(iid, values=values)
+        finally:
+            self.tree.configure(displaycolumns='#all')
             
     def cancel_reservation(self):
         selection = self.tree.selection()
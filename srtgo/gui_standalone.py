@@ -6,116 +6,467 @@ SRTGo GUI - Standalone version without CLI dependencies
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-from datetime import datetime, timedelta
+from datetime import date, timedelta
+import asyncio
+import collections
+import concurrent.futures
+import functools
+import json
+import os
+import queue
+import sys
 import threading
+import time
 import keyring
+from keyring.backends.fail import Keyring as _FailKeyring
+
 try:
-    # Test keyring functionality
-    keyring.get_password("test", "test")
-except keyring.errors.NoKeyringError:
-    # Fallback to file-based storage for environments without keyring
-    import os
-    import json
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+# File-based storage for environments without a usable keyring backend
+class FileKeyring:
+    # Set once the config directory has been created in this process
+    _dir_ready = False
     
-    class FileKeyring:
-        def __init__(self):
-            self.config_dir = os.path.expanduser("~/.srtgo")
-            self.config_file = os.path.join(self.config_dir, "config.json")
+    def __init__(self):
+        self.config_dir = os.path.expanduser("~/.srtgo")
+        self.config_file = os.path.join(self.config_dir, "config.json")
+        if not FileKeyring._dir_ready:
             os.makedirs(self.config_dir, exist_ok=True)
-            
-        def _load_config(self):
+            FileKeyring._dir_ready = True
+        # In-memory copy of config.json, loaded on first access
+        self._cache = None
+        # mtime of config.json when _cache was last synced with it
+        self._mtime = None
+        # Held across each read-modify-write; settings saves run on worker threads
+        self._lock = threading.RLock()
+        
+    def _file_mtime(self):
+        try:
+            return os.stat(self.config_file).st_mtime_ns
+        except FileNotFoundError:
+            return None
+        
+    def _load_config(self):
+        with self._lock:
+            # Before a read-modify-write, pick up changes made by another instance
+            if self._cache is not None and self._file_mtime() == self._mtime:
+                return self._cache
+            # Other OSErrors (e.g. a file locked by another process) propagate:
+            # caching {} here would make the next write wipe the saved config
+            mtime = self._file_mtime()
             try:
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except:
-                return {}
-                
-        def _save_config(self, config):
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(config, f, ensure_ascii=False, indent=2)
-                
-        def get_password(self, service, username):
-            config = self._load_config()
-            return config.get(f"{service}:{username}")
+                if mtime is None:
+                    # No config file yet (first run), nothing to parse
+                    config = {}
+                else:
+                    with open(self.config_file, 'rb') as f:
+                        data = f.read()
+                    config = orjson.loads(data) if HAS_ORJSON else json.loads(data)
+            except (FileNotFoundError, ValueError):
+                # Removed since the stat, or corrupt (JSONDecodeError/UnicodeDecodeError)
+                config = {}
+            self._mtime = mtime
+            self._cache = config
+            return self._cache
+            
+    def _save_config(self, config):
+        # Callers hold self._lock
+        self._cache = config
+        if HAS_ORJSON:
+            data = orjson.dumps(config)
+        else:
+            data = json.dumps(config, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        # Write a sibling temp file and rename it over the config so a
+        # crash mid-write never leaves a truncated config.json behind; the
+        # name is unique per process and thread so writers never share it
+        tmp = f"{self.config_file}.{os.getpid()}-{threading.get_ident()}.tmp"
+        with open(tmp, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, self.config_file)
+        self._mtime = self._file_mtime()
             
-        def set_password(self, service, username, password):
+    def get_password(self, service, username):
+        config = self._cache if self._cache is not None else self._load_config()
+        return config.get(f"{service}:{username}")
+        
+    def get_many(self, service, usernames):
+        config = self._cache if self._cache is not None else self._load_config()
+        return {u: config.get(f"{service}:{u}") for u in usernames}
+        
+    def set_password(self, service, username, password):
+        with self._lock:
             config = self._load_config()
             config[f"{service}:{username}"] = password
             self._save_config(config)
-            
-        def delete_password(self, service, username):
+        
+    def set_many(self, service, items):
+        with self._lock:
+            config = self._load_config()
+            for username, password in items.items():
+                config[f"{service}:{username}"] = password
+            self._save_config(config)
+        
+    def set_credentials(self, service, user_id, password):
+        # One record per rail type instead of separate id/pass/ok entries
+        with self._lock:
+            config = self._load_config()
+            for field in ("id", "pass", "ok"):
+                config.pop(f"{service}:{field}", None)
+            config[f"{service}:credentials"] = {"id": user_id, "pass": password, "ok": "1"}
+            self._save_config(config)
+        
+    def get_credentials(self, service):
+        config = self._cache if self._cache is not None else self._load_config()
+        creds = config.get(f"{service}:credentials")
+        if creds is None and f"{service}:id" in config:
+            # Config written before credentials were stored as one record
+            creds = {"id": config[f"{service}:id"], "pass": config.get(f"{service}:pass")}
+        return creds
+        
+    def delete_password(self, service, username):
+        with self._lock:
             config = self._load_config()
             key = f"{service}:{username}"
             if key in config:
                 del config[key]
                 self._save_config(config)
-    
-    # Replace keyring with file-based implementation
+
+
+# Inspect the resolved backend instead of probing it with a real lookup,
+# which costs a D-Bus round-trip on Linux at every import
+if isinstance(keyring.get_keyring(), _FailKeyring):
     keyring = FileKeyring()
-import sys
-import os
 
-# Add the parent directory to the path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
-from srtgo.srt import SRT
-from srtgo.ktx import Korail
+def get_many(service, usernames):
+    """Look up several keyring entries of one service in a single pass"""
+    if hasattr(keyring, "get_many"):
+        return keyring.get_many(service, usernames)
+    return {u: keyring.get_password(service, u) for u in usernames}
+
+
+# Reservation form fields, stored together as one "prefs" entry like the CLI does
+PREF_KEYS = ("departure", "arrival", "date", "time",
+             "adult", "child", "senior", "disability1to3", "disability4to6")
+
+
+# Last form values saved per rail type in this process; the keyring write
+# runs on a worker and may not have landed when the window is reopened
+_SAVED_PREFS = {}
+
+
+def get_prefs(rail_type):
+    """Get saved reservation form values (single entry first, then per-field keys)"""
+    saved = _SAVED_PREFS.get(rail_type)
+    if saved is not None:
+        return {key: saved.get(key) for key in PREF_KEYS}
+    stored = {}
+    blob = keyring.get_password(rail_type, "prefs")
+    if blob:
+        try:
+            stored = json.loads(blob)
+        except ValueError:
+            stored = {}
+    if not stored:
+        return get_many(rail_type, PREF_KEYS)
+    return {key: stored.get(key) for key in PREF_KEYS}
+
+
+def set_prefs(rail_type, prefs):
+    """Save reservation form values with a single keyring write"""
+    keyring.set_password(rail_type, "prefs", json.dumps(prefs, ensure_ascii=False, separators=(',', ':')))
+
+
+def set_many(service, items):
+    """Store several keyring entries of one service, in one write where supported"""
+    if hasattr(keyring, "set_many"):
+        keyring.set_many(service, items)
+        return
+    for username, password in items.items():
+        keyring.set_password(service, username, password)
+
+
+def set_credentials(rail_type, user_id, password):
+    """Save login credentials, as a single record when the backend supports it"""
+    if hasattr(keyring, "set_credentials"):
+        keyring.set_credentials(rail_type, user_id, password)
+        return
+    # System keyring entries are shared with the CLI, which reads each field
+    set_many(rail_type, {"id": user_id, "pass": password, "ok": "1"})
+
+
+def get_credentials(rail_type):
+    """Get saved login credentials as a dict, or None if not configured"""
+    if hasattr(keyring, "get_credentials"):
+        return keyring.get_credentials(rail_type)
+    # Skip the password lookup when no account is configured
+    user_id = keyring.get_password(rail_type, "id")
+    if user_id is None:
+        return None
+    return {"id": user_id, "pass": keyring.get_password(rail_type, "pass")}
+
+# When run as a script (python srtgo/gui_standalone.py) the srtgo package is
+# not importable yet; `python -m srtgo.gui_standalone` and package imports
+# resolve it without touching sys.path
+if __name__ == "__main__" and not __package__:
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# Fonts with Korean support, chosen once per platform
+_IS_WIN = sys.platform.startswith('win')
+# Windows Korean font, Linux/macOS generic sans
+KOREAN_FONT = 'Malgun Gothic' if _IS_WIN else 'Sans'
+DEFAULT_FONT = (KOREAN_FONT, 10)
+TITLE_FONT = (KOREAN_FONT, 20, 'bold')
+HEADING_FONT = (KOREAN_FONT, 14, 'bold')
+BUTTON_FONT = (KOREAN_FONT, 11)
+SUBTITLE_FONT = (KOREAN_FONT, 12)
+SMALL_FONT = (KOREAN_FONT, 9)
+ARROW_FONT = (KOREAN_FONT, 16)
+MONO_FONT = ('Consolas' if _IS_WIN else 'Monospace', 9)
+
+
+def _station_tuple(*names):
+    """Read-only station list with interned names for fast lookups"""
+    return tuple(map(sys.intern, names))
 
 
 STATIONS = {
-    "SRT": [
+    "SRT": _station_tuple(
         "수서", "동탄", "평택지제", "경주", "곡성", "공주", "광주송정", "구례구",
         "김천(구미)", "나주", "남원", "대전", "동대구", "마산", "목포", "밀양",
         "부산", "서대구", "순천", "여수EXPO", "여천", "오송", "울산(통도사)",
         "익산", "전주", "정읍", "진영", "진주", "창원", "창원중앙", "천안아산", "포항"
-    ],
-    "KTX": [
+    ),
+    "KTX": _station_tuple(
         "서울", "용산", "영등포", "광명", "수원", "천안아산", "오송", "대전",
         "서대전", "김천구미", "동대구", "경주", "포항", "밀양", "구포", "부산",
         "울산(통도사)", "마산", "창원중앙", "경산", "논산", "익산", "정읍",
         "광주송정", "목포", "전주", "순천", "여수EXPO", "청량리", "강릉", "행신", "정동진"
-    ]
+    )
 }
 
+# Station names as sets for validating stored selections
+STATION_SETS = {rail: frozenset(names) for rail, names in STATIONS.items()}
+
 DEFAULT_STATIONS = {
-    "SRT": ["수서", "대전", "동대구", "부산"],
-    "KTX": ["서울", "대전", "동대구", "부산"]
+    "SRT": _station_tuple("수서", "대전", "동대구", "부산"),
+    "KTX": _station_tuple("서울", "대전", "동대구", "부산")
 }
 
+# Default selections as sets, built once for get_station
+_DEFAULT_SELECTED = {rail: frozenset(names) for rail, names in DEFAULT_STATIONS.items()}
+
+# Per-rail icons and window titles, formatted once instead of on every open
+RAIL_ICONS = {"SRT": "🚄", "KTX": "🚅"}
+LOGIN_TITLES = {rail: f"🔐 {rail} 로그인 설정" for rail in RAIL_ICONS}
+STATION_TITLES = {rail: f"{rail} 역 설정" for rail in RAIL_ICONS}
+RESERVATION_TITLES = {rail: f"🎫 {rail} 기차표 예매" for rail in RAIL_ICONS}
+CHECK_TITLES = {rail: f"📋 {rail} 예매 확인" for rail in RAIL_ICONS}
+
 
+@functools.lru_cache(maxsize=4)
 def get_station(rail_type):
-    """Get available stations for rail type"""
+    """Get available stations and the set of selected stations for rail type
+    (cached until save_stations clears it)"""
     stations = STATIONS[rail_type]
     station_key = keyring.get_password(rail_type, "station")
     
     if not station_key:
-        return stations, DEFAULT_STATIONS[rail_type]
+        return stations, _DEFAULT_SELECTED[rail_type]
     
-    valid_keys = [x for x in station_key.split(",")]
-    return stations, valid_keys
+    # Silently drop stored names that are no longer in the station list
+    known = STATION_SETS[rail_type]
+    valid_keys = frozenset(sys.intern(x) for x in station_key.split(",") if x in known)
+    # Nothing usable left; fall back to the defaults rather than empty lists
+    return stations, valid_keys or _DEFAULT_SELECTED[rail_type]
 
 
+def get_rail_class(rail_type):
+    """Import the client for rail type on first use to keep GUI startup light"""
+    if rail_type == "SRT":
+        from srtgo.srt import SRT
+        return SRT
+    from srtgo.ktx import Korail
+    return Korail
+
+
+# Logged-in rail clients reused across windows: {(rail_type, id, pass): (client, login time)}
+_RAIL_SESSIONS = {}
+_RAIL_SESSIONS_LOCK = threading.Lock()
+_SESSION_TTL = 600
+
+
+def get_rail(rail_type, user_id, password, debug=False):
+    """Get a logged-in client, reusing one created within the last _SESSION_TTL seconds"""
+    key = (rail_type, user_id, password)
+    with _RAIL_SESSIONS_LOCK:
+        cached = _RAIL_SESSIONS.get(key)
+        if cached is not None and time.monotonic() - cached[1] < _SESSION_TTL:
+            return cached[0]
+    rail = get_rail_class(rail_type)(user_id, password, verbose=debug)
+    with _RAIL_SESSIONS_LOCK:
+        _RAIL_SESSIONS[key] = (rail, time.monotonic())
+    return rail
+
+
+# Shared worker threads for blocking keyring and network calls, also used as
+# the event loop's default executor so no call spawns a fresh thread
+_WORKER_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="srtgo-worker")
+
+# Event loop for reservation coroutines, run on its own daemon thread
+_LOOP = asyncio.new_event_loop()
+_LOOP.set_default_executor(_WORKER_POOL)
+_LOOP_THREAD = None
+
+
+def _ensure_loop():
+    global _LOOP_THREAD
+    if _LOOP_THREAD is None:
+        _LOOP_THREAD = threading.Thread(target=_LOOP.run_forever, name="srtgo-asyncio", daemon=True)
+        _LOOP_THREAD.start()
+
+
+# Interval for writing queued status log lines into the Text widget
+_LOG_FLUSH_MS = 50
+
+# Interval for checking whether a background login test or reservation
+# lookup has finished
+_LOGIN_POLL_MS = 100
+
+
+SEAT_TYPES = ("일반실 우선", "일반실만", "특실 우선", "특실만")
+TIME_CHOICES = tuple(f"{h:02d}:00" for h in range(6, 24))  # 06:00 ~ 23:00
+_TIME_VALUE_BY_DISPLAY = {t: f"{t[:2]}0000" for t in TIME_CHOICES}
+
+
+@functools.lru_cache(maxsize=1)
+def _build_date_choices(day_ordinal):
+    """Date combobox entries for the next 30 days, rebuilt only when the day changes"""
+    start = date.fromordinal(day_ordinal)
+    displays = []
+    display_by_value = {}
+    value_by_display = {}
+    for i in range(30):
+        d = start + timedelta(days=i)
+        display = d.strftime("%Y-%m-%d (%a)")
+        value = d.strftime("%Y%m%d")
+        displays.append(display)
+        display_by_value[value] = display
+        value_by_display[display] = value
+    return tuple(displays), display_by_value, value_by_display
+
+
+@functools.lru_cache(maxsize=1)
 def get_options():
-    """Get passenger options"""
+    """Get passenger options (cached until save_options clears it)"""
     options = keyring.get_password("SRT", "options") or ""
-    return options.split(",") if options else []
+    return frozenset(options.split(",")) if options else frozenset()
+
+
+# Tcl interpreter whose named ttk styles are configured; styles belong to the
+# interpreter, so every window of one tk.Tk() shares them
+_STYLED_INTERP = None
+
+
+def _ensure_styles(root):
+    """Configure the named ttk styles once per Tcl interpreter"""
+    global _STYLED_INTERP
+    if _STYLED_INTERP is root.tk:
+        return
+    style = ttk.Style(root)
+    style.theme_use('clam')
+    
+    # Configure fonts with Korean support
+    default_font = DEFAULT_FONT
+    title_font = TITLE_FONT
+    heading_font = HEADING_FONT
+    button_font = BUTTON_FONT
+    
+    # Color scheme
+    primary_color = '#2E86AB'    # Blue
+    secondary_color = '#A23B72'  # Purple  
+    success_color = '#F18F01'    # Orange
+    
+    # Configure styles
+    style.configure('Title.TLabel', 
+                   font=title_font, 
+                   foreground=primary_color,
+                   background='white')
+    
+    style.configure('Heading.TLabel', 
+                   font=heading_font, 
+                   foreground='#333333')
+    
+    style.configure('Success.TLabel', 
+                   foreground=success_color, 
+                   font=(default_font[0], 11, 'bold'))
+    
+    # Secondary text styles, so child windows don't pass fonts per label
+    style.configure('Desc.TLabel', foreground='#666666')
+    style.configure('Help.TLabel', foreground='#999999', font=SMALL_FONT)
+    style.configure('Info.TLabel', foreground=primary_color, font=SMALL_FONT)
+    
+    # Button styles: (name, background, active, pressed, padding)
+    for name, background, active, pressed, padding in (
+            ('Primary.TButton', primary_color, '#1E5F7A', '#154A61', (20, 10)),
+            ('Secondary.TButton', secondary_color, '#8B2F5A', '#6B2346', (15, 8))):
+        style.configure(name,
+                       font=button_font,
+                       foreground='white',
+                       background=background,
+                       borderwidth=0,
+                       focuscolor='none',
+                       padding=padding)
+        style.map(name, background=[('active', active), ('pressed', pressed)])
+    
+    # Frame styles
+    style.configure('Card.TFrame',
+                   background='white',
+                   relief='raised',
+                   borderwidth=1)
+    
+    style.configure('Primary.TLabelFrame',
+                   background='white',
+                   relief='solid',
+                   borderwidth=1)
+    
+    style.configure('Primary.TLabelFrame.Label',
+                   font=heading_font,
+                   foreground=primary_color,
+                   background='white')
+    
+    _STYLED_INTERP = root.tk
 
 
 class SRTGoGUI:
+    # Initial window size, known up front so centering needs no layout pass
+    SIZE = (900, 700)
+    
     def __init__(self):
         self.root = tk.Tk()
         self.root.title("🚅 SRTGo - 기차표 예약 프로그램")
-        self.root.geometry("900x700")
         self.root.minsize(800, 600)
         self.root.resizable(True, True)
         
-        # Center window on screen
+        # Size and center window on screen
         self.center_window()
         
         # Variables
         self.rail_type = tk.StringVar(value="SRT")
         self.debug_mode = tk.BooleanVar(value=False)
         
+        # Settings dialogs are built once and hidden on close, then reused
+        self._dialogs = {}
+        
+        # Whether login credentials exist, per rail type (filled on first check)
+        self._login_ok = {}
+        
         # Style configuration
         self.setup_styles()
         
@@ -124,101 +475,17 @@ class SRTGoGUI:
         
     def center_window(self):
         """Center the window on screen"""
-        self.root.update_idletasks()
-        width = self.root.winfo_width()
-        height = self.root.winfo_height()
+        width, height = self.SIZE
         x = (self.root.winfo_screenwidth() // 2) - (width // 2)
         y = (self.root.winfo_screenheight() // 2) - (height // 2)
-        self.root.geometry(f"+{x}+{y}")
+        self.root.geometry(f"{width}x{height}+{x}+{y}")
         
     def setup_styles(self):
-        style = ttk.Style()
-        style.theme_use('clam')
-        
-        # Configure fonts with Korean support
-        import sys
-        if sys.platform.startswith('win'):
-            # Windows Korean fonts
-            default_font = ('Malgun Gothic', 10)
-            title_font = ('Malgun Gothic', 20, 'bold')
-            heading_font = ('Malgun Gothic', 14, 'bold')
-            button_font = ('Malgun Gothic', 11)
-        else:
-            # Linux/macOS fonts
-            default_font = ('Sans', 10)
-            title_font = ('Sans', 20, 'bold') 
-            heading_font = ('Sans', 14, 'bold')
-            button_font = ('Sans', 11)
-        
-        # Color scheme
-        primary_color = '#2E86AB'    # Blue
-        secondary_color = '#A23B72'  # Purple  
-        success_color = '#F18F01'    # Orange
-        danger_color = '#C73E1D'     # Red
-        bg_color = '#F5F5F5'         # Light gray
-        
-        # Configure styles
-        style.configure('Title.TLabel', 
-                       font=title_font, 
-                       foreground=primary_color,
-                       background='white')
-        
-        style.configure('Heading.TLabel', 
-                       font=heading_font, 
-                       foreground='#333333')
-        
-        style.configure('Success.TLabel', 
-                       foreground=success_color, 
-                       font=(default_font[0], 11, 'bold'))
-        
-        style.configure('Error.TLabel', 
-                       foreground=danger_color, 
-                       font=(default_font[0], 11, 'bold'))
-        
-        # Button styles
-        style.configure('Primary.TButton',
-                       font=button_font,
-                       foreground='white',
-                       background=primary_color,
-                       borderwidth=0,
-                       focuscolor='none',
-                       padding=(20, 10))
-        
-        style.map('Primary.TButton',
-                 background=[('active', '#1E5F7A'),
-                            ('pressed', '#154A61')])
-        
-        style.configure('Secondary.TButton',
-                       font=button_font,
-                       foreground='white', 
-                       background=secondary_color,
-                       borderwidth=0,
-                       focuscolor='none',
-                       padding=(15, 8))
-        
-        style.map('Secondary.TButton',
-                 background=[('active', '#8B2F5A'),
-                            ('pressed', '#6B2346')])
-        
-        # Frame styles
-        style.configure('Card.TFrame',
-                       background='white',
-                       relief='raised',
-                       borderwidth=1)
-        
-        style.configure('Primary.TLabelFrame',
-                       background='white',
-                       relief='solid',
-                       borderwidth=1)
-        
-        style.configure('Primary.TLabelFrame.Label',
-                       font=heading_font,
-                       foreground=primary_color,
-                       background='white')
+        _ensure_styles(self.root)
         
         # Set default font and colors
-        self.root.option_add('*Font', default_font)
-        self.root.configure(bg=bg_color)
+        self.root.option_add('*Font', DEFAULT_FONT)
+        self.root.configure(bg='#F5F5F5')
         
     def create_main_interface(self):
         # Create main container with padding
@@ -240,7 +507,7 @@ class SRTGoGUI:
         
         subtitle_label = ttk.Label(header_content, 
                                   text="기차표 예약 프로그램 설정 도구", 
-                                  font=('Malgun Gothic' if self.root.tk.call('tk', 'windowingsystem') == 'win32' else 'Sans', 12))
+                                  font=SUBTITLE_FONT)
         subtitle_label.pack(pady=(5, 0))
         
         # Rail type selection card
@@ -305,7 +572,7 @@ class SRTGoGUI:
         
         reservation_desc = ttk.Label(reservation_frame, 
                               text="실시간 기차표 예매 및 예약 확인",
-                              foreground='#666666')
+                              style='Desc.TLabel')
         reservation_desc.pack(side='left', anchor='w')
         
         # Separator
@@ -329,7 +596,7 @@ class SRTGoGUI:
         
         login_desc = ttk.Label(login_frame, 
                               text="SRT/KTX 계정 정보를 설정합니다",
-                              foreground='#666666')
+                              style='Desc.TLabel')
         login_desc.pack(side='left', anchor='w')
         
         # Row 2: Station settings  
@@ -343,7 +610,7 @@ class SRTGoGUI:
         
         station_desc = ttk.Label(station_frame,
                                text="예매할 출발/도착 역을 선택합니다",
-                               foreground='#666666')
+                               style='Desc.TLabel')
         station_desc.pack(side='left', anchor='w')
         
         # Row 3: Options settings
@@ -357,7 +624,7 @@ class SRTGoGUI:
         
         options_desc = ttk.Label(options_frame,
                                text="승객 유형 및 기타 옵션을 설정합니다",
-                               foreground='#666666')
+                               style='Desc.TLabel')
         options_desc.pack(side='left', anchor='w')
         
         # Quick actions
@@ -398,7 +665,7 @@ class SRTGoGUI:
     def start_reservation(self):
         # Check if login is configured
         rail_type = self.rail_type.get()
-        if not keyring.get_password(rail_type, "id"):
+        if not self._is_logged_in(rail_type):
             messagebox.showwarning("로그인 필요", 
                                  f"{rail_type} 로그인 정보가 설정되지 않았습니다.\n먼저 로그인 설정을 완료해주세요.")
             self.setup_login()
@@ -409,7 +676,7 @@ class SRTGoGUI:
     def check_reservations(self):
         # Check if login is configured
         rail_type = self.rail_type.get()
-        if not keyring.get_password(rail_type, "id"):
+        if not self._is_logged_in(rail_type):
             messagebox.showwarning("로그인 필요", 
                                  f"{rail_type} 로그인 정보가 설정되지 않았습니다.\n먼저 로그인 설정을 완료해주세요.")
             self.setup_login()
@@ -417,54 +684,104 @@ class SRTGoGUI:
             
         ReservationCheckWindow(self.root, rail_type, self.debug_mode.get())
         
+    def _is_logged_in(self, rail_type):
+        ok = self._login_ok.get(rail_type)
+        if ok is None:
+            ok = self._login_ok[rail_type] = bool(get_credentials(rail_type))
+        return ok
+        
+    def _on_login_saved(self, rail_type):
+        self._login_ok[rail_type] = True
+        
     def setup_login(self):
-        LoginSetupWindow(self.root, self.rail_type.get(), self.debug_mode.get())
+        rail_type = self.rail_type.get()
+        dialog = self._dialogs.get(("login", rail_type))
+        if dialog is None:
+            self._dialogs["login", rail_type] = LoginSetupWindow(self.root, rail_type, self.debug_mode.get(),
+                                                                 on_saved=self._on_login_saved)
+        else:
+            dialog.show(self.debug_mode.get())
         
     def setup_stations(self):
-        StationSetupWindow(self.root, self.rail_type.get())
+        rail_type = self.rail_type.get()
+        dialog = self._dialogs.get(("station", rail_type))
+        if dialog is None:
+            self._dialogs["station", rail_type] = StationSetupWindow(self.root, rail_type)
+        else:
+            dialog.show()
         
     def setup_options(self):
-        OptionsSetupWindow(self.root)
+        dialog = self._dialogs.get("options")
+        if dialog is None:
+            self._dialogs["options"] = OptionsSetupWindow(self.root)
+        else:
+            dialog.show()
         
     def run(self):
         self.root.mainloop()
 
 
 class LoginSetupWindow:
-    def __init__(self, parent, rail_type, debug):
+    SIZE = (450, 280)
+    
+    def __init__(self, parent, rail_type, debug, on_saved=None):
         self.rail_type = rail_type
         self.debug = debug
+        # Called with the rail type once credentials are stored
+        self.on_saved = on_saved
         
         self.window = tk.Toplevel(parent)
-        self.window.title(f"🔐 {rail_type} 로그인 설정")
-        self.window.geometry("450x280")
+        _ensure_styles(self.window)
+        self.window.title(LOGIN_TITLES[rail_type])
         self.window.resizable(False, False)
         self.window.grab_set()  # Modal dialog
+        self.window.protocol("WM_DELETE_WINDOW", self.hide)
         
-        # Center the window
+        # Size and center the window
         self.center_window()
         
         self.create_interface()
         
+    def show(self, debug):
+        """Re-open the hidden dialog with fresh values"""
+        self.debug = debug
+        self.window.deiconify()
+        self.center_window()
+        self.window.grab_set()
+        self.refresh()
+        
+    def hide(self):
+        self.window.grab_release()
+        self.window.withdraw()
+        
+    def refresh(self):
+        """Reset the form from the saved credentials"""
+        creds = get_credentials(self.rail_type)
+        current_id = creds["id"] if creds else ""
+        self.id_var.set(current_id)
+        self.pass_var.set("")
+        self.save_button.state(['!disabled'])
+        
+        # Focus on appropriate field
+        if current_id:
+            self.pass_entry.focus_set()
+        else:
+            self.id_entry.focus_set()
+        
     def center_window(self):
         """Center the window on parent"""
-        self.window.update_idletasks()
         parent_x = self.window.master.winfo_x()
         parent_y = self.window.master.winfo_y()
         parent_width = self.window.master.winfo_width()
         parent_height = self.window.master.winfo_height()
         
-        width = self.window.winfo_width()
-        height = self.window.winfo_height()
+        width, height = self.SIZE
         
         x = parent_x + (parent_width // 2) - (width // 2)
         y = parent_y + (parent_height // 2) - (height // 2)
-        self.window.geometry(f"+{x}+{y}")
+        self.window.geometry(f"{width}x{height}+{x}+{y}")
         
     def create_interface(self):
-        # Get existing credentials
-        current_id = keyring.get_password(self.rail_type, "id") or ""
-        
         # Main container with padding
         main_frame = ttk.Frame(self.window)
         main_frame.pack(fill='both', expand=True, padx=25, pady=20)
@@ -473,14 +790,14 @@ class LoginSetupWindow:
         header_frame = ttk.Frame(main_frame)
         header_frame.pack(fill='x', pady=(0, 20))
         
-        rail_icon = "🚄" if self.rail_type == "SRT" else "🚅"
+        rail_icon = RAIL_ICONS[self.rail_type]
         ttk.Label(header_frame, 
                  text=f"{rail_icon} {self.rail_type} 로그인 설정", 
                  style='Heading.TLabel').pack()
         
         ttk.Label(header_frame,
                  text="계정 정보를 입력하여 자동 로그인을 설정하세요",
-                 foreground='#666666').pack(pady=(5, 0))
+                 style='Desc.TLabel').pack(pady=(5, 0))
         
         # Input section
         input_frame = ttk.LabelFrame(main_frame, text="계정 정보", padding=15)
@@ -491,15 +808,14 @@ class LoginSetupWindow:
         id_frame.pack(fill='x', pady=(0, 10))
         
         ttk.Label(id_frame, text="아이디:", width=12).pack(side='left')
-        self.id_var = tk.StringVar(value=current_id)
-        id_entry = ttk.Entry(id_frame, textvariable=self.id_var, width=25)
-        id_entry.pack(side='left', fill='x', expand=True, padx=(5, 0))
+        self.id_var = tk.StringVar()
+        self.id_entry = ttk.Entry(id_frame, textvariable=self.id_var, width=25)
+        self.id_entry.pack(side='left', fill='x', expand=True, padx=(5, 0))
         
         # Help text for ID
         ttk.Label(input_frame, 
                  text="멤버십 번호, 이메일 주소 또는 전화번호",
-                 foreground='#999999',
-                 font=('Malgun Gothic' if self.window.tk.call('tk', 'windowingsystem') == 'win32' else 'Sans', 9)).pack(anchor='w', pady=(0, 10))
+                 style='Help.TLabel').pack(anchor='w', pady=(0, 10))
         
         # Password field  
         pass_frame = ttk.Frame(input_frame)
@@ -507,8 +823,8 @@ class LoginSetupWindow:
         
         ttk.Label(pass_frame, text="비밀번호:", width=12).pack(side='left')
         self.pass_var = tk.StringVar()
-        pass_entry = ttk.Entry(pass_frame, textvariable=self.pass_var, show='*', width=25)
-        pass_entry.pack(side='left', fill='x', expand=True, padx=(5, 0))
+        self.pass_entry = ttk.Entry(pass_frame, textvariable=self.pass_var, show='*', width=25)
+        self.pass_entry.pack(side='left', fill='x', expand=True, padx=(5, 0))
         
         # Security note
         security_frame = ttk.Frame(main_frame)
@@ -516,48 +832,70 @@ class LoginSetupWindow:
         
         ttk.Label(security_frame,
                  text="🔒 비밀번호는 안전하게 암호화되어 저장됩니다",
-                 foreground='#2E86AB',
-                 font=('Malgun Gothic' if self.window.tk.call('tk', 'windowingsystem') == 'win32' else 'Sans', 9)).pack()
+                 style='Info.TLabel').pack()
         
         # Buttons
         button_frame = ttk.Frame(main_frame)
         button_frame.pack(fill='x')
         
-        ttk.Button(button_frame, 
+        self.save_button = ttk.Button(button_frame, 
                   text="💾 저장", 
                   style='Primary.TButton',
-                  command=self.save_login).pack(side='right', padx=(10, 0))
+                  command=self.save_login)
+        self.save_button.pack(side='right', padx=(10, 0))
         
         ttk.Button(button_frame, 
                   text="취소",
-                  command=self.window.destroy).pack(side='right')
+                  command=self.hide).pack(side='right')
         
-        # Focus on appropriate field
-        if current_id:
-            pass_entry.focus_set()
-        else:
-            id_entry.focus_set()
+        self.refresh()
         
     def save_login(self):
-        if not self.id_var.get() or not self.pass_var.get():
+        user_id = self.id_var.get()
+        password = self.pass_var.get()
+        if not user_id or not password:
             messagebox.showerror("오류", "아이디와 비밀번호를 모두 입력하세요.")
             return
             
+        # Test login off the Tk thread so the window stays responsive; the
+        # worker only reports through the queue and never touches Tk itself
+        self.save_button.state(['disabled'])
+        results = queue.Queue()
+        _WORKER_POOL.submit(self._do_login, user_id, password, results)
+        self.window.after(_LOGIN_POLL_MS, self._poll_login, user_id, password, results)
+        
+    def _do_login(self, user_id, password, results):
         try:
-            # Test login
-            rail = SRT if self.rail_type == "SRT" else Korail
-            test_rail = rail(self.id_var.get(), self.pass_var.get(), verbose=self.debug)
-            
-            # Save credentials
-            keyring.set_password(self.rail_type, "id", self.id_var.get())
-            keyring.set_password(self.rail_type, "pass", self.pass_var.get())
-            keyring.set_password(self.rail_type, "ok", "1")
+            # Also leaves the session cached for the reservation windows
+            get_rail(self.rail_type, user_id, password, self.debug)
+        except Exception as e:
+            results.put(str(e))
+        else:
+            results.put(None)
             
-            messagebox.showinfo("성공", "로그인 정보가 저장되었습니다.")
-            self.window.destroy()
+    def _poll_login(self, user_id, password, results):
+        try:
+            error = results.get_nowait()
+        except queue.Empty:
+            self.window.after(_LOGIN_POLL_MS, self._poll_login, user_id, password, results)
+            return
+        self._finish_login(user_id, password, error)
             
-        except Exception as e:
-            messagebox.showerror("오류", f"로그인 실패: {str(e)}")
+    def _finish_login(self, user_id, password, error):
+        # Runs on the Tk thread; only the login test ran on the worker
+        if error is None:
+            try:
+                set_credentials(self.rail_type, user_id, password)
+            except Exception as e:
+                error = str(e)
+        if error is not None:
+            self.save_button.state(['!disabled'])
+            messagebox.showerror("오류", f"로그인 실패: {error}")
+            return
+        if self.on_saved is not None:
+            self.on_saved(self.rail_type)
+        messagebox.showinfo("성공", "로그인 정보가 저장되었습니다.")
+        self.hide()
 
 
 class StationSetupWindow:
@@ -565,44 +903,47 @@ class StationSetupWindow:
         self.rail_type = rail_type
         
         self.window = tk.Toplevel(parent)
-        self.window.title(f"{rail_type} 역 설정")
+        _ensure_styles(self.window)
+        self.window.title(STATION_TITLES[rail_type])
         self.window.geometry("400x500")
+        self.window.protocol("WM_DELETE_WINDOW", self.hide)
         
         self.create_interface()
         
+    def show(self):
+        """Re-open the hidden dialog with the saved selection"""
+        self.refresh()
+        self.window.deiconify()
+        
+    def hide(self):
+        self.window.withdraw()
+        
+    def refresh(self):
+        _, selected_stations = get_station(self.rail_type)
+        self.station_list.selection_clear(0, 'end')
+        for i, station in enumerate(self.stations):
+            if station in selected_stations:
+                self.station_list.selection_set(i)
+        
     def create_interface(self):
         ttk.Label(self.window, text=f"{self.rail_type} 역 선택", 
                  style='Heading.TLabel').pack(pady=10)
         
-        # Station listbox with checkboxes
+        # Station listbox (multiple selection)
         list_frame = ttk.Frame(self.window)
         list_frame.pack(fill='both', expand=True, padx=20, pady=10)
         
-        # Get current station selection
-        stations, selected_stations = get_station(self.rail_type)
-        
-        self.station_vars = {}
-        
-        # Create scrollable frame
-        canvas = tk.Canvas(list_frame)
-        scrollbar = ttk.Scrollbar(list_frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas)
+        self.stations = STATIONS[self.rail_type]
         
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        self.station_list = tk.Listbox(list_frame, selectmode='extended', exportselection=False)
+        scrollbar = ttk.Scrollbar(list_frame, orient="vertical", command=self.station_list.yview)
+        self.station_list.configure(yscrollcommand=scrollbar.set)
         
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
+        self.station_list.insert('end', *self.stations)
+        # Select the current station choice
+        self.refresh()
         
-        # Add checkboxes for each station
-        for station in stations:
-            var = tk.BooleanVar(value=station in selected_stations)
-            self.station_vars[station] = var
-            ttk.Checkbutton(scrollable_frame, text=station, variable=var).pack(anchor='w', pady=2)
-        
-        canvas.pack(side="left", fill="both", expand=True)
+        self.station_list.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
         
         # Buttons
@@ -612,18 +953,16 @@ class StationSetupWindow:
         ttk.Button(button_frame, text="전체 선택", command=self.select_all).pack(side='left', padx=5)
         ttk.Button(button_frame, text="전체 해제", command=self.deselect_all).pack(side='left', padx=5)
         ttk.Button(button_frame, text="저장", command=self.save_stations).pack(side='left', padx=10)
-        ttk.Button(button_frame, text="취소", command=self.window.destroy).pack(side='left', padx=5)
+        ttk.Button(button_frame, text="취소", command=self.hide).pack(side='left', padx=5)
         
     def select_all(self):
-        for var in self.station_vars.values():
-            var.set(True)
+        self.station_list.selection_set(0, 'end')
             
     def deselect_all(self):
-        for var in self.station_vars.values():
-            var.set(False)
+        self.station_list.selection_clear(0, 'end')
             
     def save_stations(self):
-        selected = [station for station, var in self.station_vars.items() if var.get()]
+        selected = [self.stations[i] for i in self.station_list.curselection()]
         
         if not selected:
             messagebox.showerror("오류", "최소 하나의 역을 선택하세요.")
@@ -631,21 +970,41 @@ class StationSetupWindow:
             
         try:
             keyring.set_password(self.rail_type, "station", ",".join(selected))
+            get_station.cache_clear()
             messagebox.showinfo("성공", f"선택된 역: {', '.join(selected)}")
-            self.window.destroy()
+            self.hide()
             
         except Exception as e:
             messagebox.showerror("오류", f"저장 실패: {str(e)}")
 
 
 class OptionsSetupWindow:
+    # Option keys with their checkbox labels
+    _OPTS = (("child", "어린이"), ("senior", "경로우대"), ("disability1to3", "중증장애인"),
+             ("disability4to6", "경증장애인"), ("ktx", "KTX만"))
+    
     def __init__(self, parent):
         self.window = tk.Toplevel(parent)
+        _ensure_styles(self.window)
         self.window.title("예매 옵션 설정")
         self.window.geometry("300x250")
+        self.window.protocol("WM_DELETE_WINDOW", self.hide)
         
         self.create_interface()
         
+    def show(self):
+        """Re-open the hidden dialog with the saved options"""
+        self.refresh()
+        self.window.deiconify()
+        
+    def hide(self):
+        self.window.withdraw()
+        
+    def refresh(self):
+        current_options = get_options()
+        for key, var in self.option_vars.items():
+            var.set(key in current_options)
+        
     def create_interface(self):
         ttk.Label(self.window, text="예매 옵션 선택", 
                  style='Heading.TLabel').pack(pady=10)
@@ -655,62 +1014,58 @@ class OptionsSetupWindow:
         
         current_options = get_options()
         
-        self.child_var = tk.BooleanVar(value="child" in current_options)
-        ttk.Checkbutton(option_frame, text="어린이", variable=self.child_var).pack(anchor='w', pady=5)
-        
-        self.senior_var = tk.BooleanVar(value="senior" in current_options)
-        ttk.Checkbutton(option_frame, text="경로우대", variable=self.senior_var).pack(anchor='w', pady=5)
-        
-        self.disability1to3_var = tk.BooleanVar(value="disability1to3" in current_options)
-        ttk.Checkbutton(option_frame, text="중증장애인", variable=self.disability1to3_var).pack(anchor='w', pady=5)
-        
-        self.disability4to6_var = tk.BooleanVar(value="disability4to6" in current_options)
-        ttk.Checkbutton(option_frame, text="경증장애인", variable=self.disability4to6_var).pack(anchor='w', pady=5)
-        
-        self.ktx_var = tk.BooleanVar(value="ktx" in current_options)
-        ttk.Checkbutton(option_frame, text="KTX만", variable=self.ktx_var).pack(anchor='w', pady=5)
+        self.option_vars = {key: tk.BooleanVar(value=key in current_options) for key, _ in self._OPTS}
+        for key, label in self._OPTS:
+            ttk.Checkbutton(option_frame, text=label, variable=self.option_vars[key]).pack(anchor='w', pady=5)
         
         # Buttons
         button_frame = ttk.Frame(self.window)
         button_frame.pack(pady=20)
         
         ttk.Button(button_frame, text="저장", command=self.save_options).pack(side='left', padx=10)
-        ttk.Button(button_frame, text="취소", command=self.window.destroy).pack(side='left', padx=10)
+        ttk.Button(button_frame, text="취소", command=self.hide).pack(side='left', padx=10)
         
     def save_options(self):
-        options = []
-        if self.child_var.get():
-            options.append("child")
-        if self.senior_var.get():
-            options.append("senior")
-        if self.disability1to3_var.get():
-            options.append("disability1to3")
-        if self.disability4to6_var.get():
-            options.append("disability4to6")
-        if self.ktx_var.get():
-            options.append("ktx")
+        options = [key for key, var in self.option_vars.items() if var.get()]
             
         try:
-            keyring.set_password("SRT", "options", ",".join(options))
+            new = ",".join(options)
+            old = keyring.get_password("SRT", "options") or ""
+            # Only touch storage when the selection actually changed
+            if new != old:
+                if new:
+                    keyring.set_password("SRT", "options", new)
+                else:
+                    keyring.delete_password("SRT", "options")
+                get_options.cache_clear()
             messagebox.showinfo("성공", "예매 옵션이 저장되었습니다.")
-            self.window.destroy()
+            self.hide()
             
         except Exception as e:
             messagebox.showerror("오류", f"저장 실패: {str(e)}")
 
 
 class ReservationWindow:
+    SIZE = (600, 800)
+    
+    # Passenger types with their default counts
+    _PAX = (("adult", 1), ("child", 0), ("senior", 0), ("disability1to3", 0), ("disability4to6", 0))
+    # Passenger rows shown only when enabled in the options dialog
+    _PAX_OPTIONAL = (("child", "어린이:"), ("senior", "경로우대:"),
+                     ("disability1to3", "중증장애인:"), ("disability4to6", "경증장애인:"))
+    
     def __init__(self, parent, rail_type, debug):
         self.rail_type = rail_type
         self.debug = debug
         
         self.window = tk.Toplevel(parent)
-        self.window.title(f"🎫 {rail_type} 기차표 예매")
-        self.window.geometry("600x800")
+        _ensure_styles(self.window)
+        self.window.title(RESERVATION_TITLES[rail_type])
         self.window.resizable(False, False)
         self.window.grab_set()
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
         
-        # Center the window
+        # Size and center the window
         self.center_window()
         
         # Initialize variables
@@ -720,18 +1075,16 @@ class ReservationWindow:
         
     def center_window(self):
         """Center the window on parent"""
-        self.window.update_idletasks()
         parent_x = self.window.master.winfo_x()
         parent_y = self.window.master.winfo_y()
         parent_width = self.window.master.winfo_width()
         parent_height = self.window.master.winfo_height()
         
-        width = self.window.winfo_width()
-        height = self.window.winfo_height()
+        width, height = self.SIZE
         
         x = parent_x + (parent_width // 2) - (width // 2)
         y = parent_y + (parent_height // 2) - (height // 2)
-        self.window.geometry(f"+{x}+{y}")
+        self.window.geometry(f"{width}x{height}+{x}+{y}")
         
     def setup_variables(self):
         """Initialize form variables with saved values"""
@@ -744,24 +1097,34 @@ class ReservationWindow:
         default_departure = "수서" if is_srt else "서울"
         
         # Get saved values or defaults
-        self.departure_var = tk.StringVar(value=keyring.get_password(self.rail_type, "departure") or default_departure)
-        self.arrival_var = tk.StringVar(value=keyring.get_password(self.rail_type, "arrival") or "동대구")
-        self.date_var = tk.StringVar(value=keyring.get_password(self.rail_type, "date") or today)
-        self.time_var = tk.StringVar(value=keyring.get_password(self.rail_type, "time") or "120000")
+        vals = get_prefs(self.rail_type)
+        self.departure_var = tk.StringVar(value=vals["departure"] or default_departure)
+        self.arrival_var = tk.StringVar(value=vals["arrival"] or "동대구")
+        self.date_var = tk.StringVar(value=vals["date"] or today)
+        self.time_var = tk.StringVar(value=vals["time"] or "120000")
         
         # Passenger counts
-        self.adult_var = tk.IntVar(value=int(keyring.get_password(self.rail_type, "adult") or 1))
-        self.child_var = tk.IntVar(value=int(keyring.get_password(self.rail_type, "child") or 0))
-        self.senior_var = tk.IntVar(value=int(keyring.get_password(self.rail_type, "senior") or 0))
-        self.disability1to3_var = tk.IntVar(value=int(keyring.get_password(self.rail_type, "disability1to3") or 0))
-        self.disability4to6_var = tk.IntVar(value=int(keyring.get_password(self.rail_type, "disability4to6") or 0))
+        self.pax_vars = {k: tk.IntVar(value=int(vals[k] or d)) for k, d in self._PAX}
+        # Running passenger total, kept current by traces on the count variables
+        self._total_passengers = 0
+        for var in self.pax_vars.values():
+            var.trace_add('write', self._recalc_total)
+        self._recalc_total()
         
         # Seat preference
-        self.seat_type_var = tk.StringVar(value="일반실 우선")
+        self.seat_type_var = tk.StringVar(value=SEAT_TYPES[0])
         self.auto_pay_var = tk.BooleanVar(value=False)
         
         # Status
         self.is_running = False
+        self._future = None
+        # Status lines from any thread; drained by _poll_status on the Tk thread
+        self._log_queue = collections.deque()
+        self._polling = False
+        # Settings writes still running on the worker pool
+        self._pending_saves = set()
+        # (second, "HH:MM:SS") of the last log line, replaced as one tuple
+        self._last_ts = (None, "")
         
     def create_interface(self):
         # Main container
@@ -772,7 +1135,7 @@ class ReservationWindow:
         header_frame = ttk.Frame(main_frame)
         header_frame.pack(fill='x', pady=(0, 20))
         
-        rail_icon = "🚄" if self.rail_type == "SRT" else "🚅"
+        rail_icon = RAIL_ICONS[self.rail_type]
         ttk.Label(header_frame, 
                  text=f"{rail_icon} {self.rail_type} 기차표 예매", 
                  style='Title.TLabel').pack()
@@ -790,18 +1153,21 @@ class ReservationWindow:
         
         ttk.Label(dep_frame, text="출발역").pack(anchor='w')
         stations, selected_stations = get_station(self.rail_type)
-        dep_combo = ttk.Combobox(dep_frame, textvariable=self.departure_var, values=selected_stations, width=15)
+        # Keep the combobox in route order; the selection itself is a set.
+        # One tuple is shared by both comboboxes.
+        station_values = tuple(station for station in stations if station in selected_stations)
+        dep_combo = ttk.Combobox(dep_frame, textvariable=self.departure_var, values=station_values, width=15)
         dep_combo.pack(fill='x', pady=(5, 0))
         
         # Arrow
-        ttk.Label(route_grid, text="→", font=('Sans', 16)).pack(side='left', padx=10)
+        ttk.Label(route_grid, text="→", font=ARROW_FONT).pack(side='left', padx=10)
         
         # Arrival station
         arr_frame = ttk.Frame(route_grid)
         arr_frame.pack(side='left', fill='x', expand=True, padx=(10, 0))
         
         ttk.Label(arr_frame, text="도착역").pack(anchor='w')
-        arr_combo = ttk.Combobox(arr_frame, textvariable=self.arrival_var, values=selected_stations, width=15)
+        arr_combo = ttk.Combobox(arr_frame, textvariable=self.arrival_var, values=station_values, width=15)
         arr_combo.pack(fill='x', pady=(5, 0))
         
         # Date and time
@@ -817,91 +1183,61 @@ class ReservationWindow:
         
         ttk.Label(date_frame, text="출발 날짜").pack(anchor='w')
         
-        # Generate date choices
-        from datetime import datetime, timedelta
-        now = datetime.now()
-        date_choices = []
-        for i in range(30):
-            date_obj = now + timedelta(days=i)
-            date_str = date_obj.strftime("%Y-%m-%d (%a)")
-            date_val = date_obj.strftime("%Y%m%d")
-            date_choices.append((date_str, date_val))
-        
-        date_combo = ttk.Combobox(date_frame, values=[choice[0] for choice in date_choices], width=18)
+        # Date choices are built once per day
+        date_displays, display_by_value, value_by_display = _build_date_choices(date.today().toordinal())
+        
+        # The combobox edits a display variable; a trace maps it back to date_var
+        self._date_display_var = tk.StringVar(value=display_by_value.get(self.date_var.get(), date_displays[0]))
+        date_combo = ttk.Combobox(date_frame, textvariable=self._date_display_var, values=date_displays, width=18)
         date_combo.pack(fill='x', pady=(5, 0))
         
-        # Set current date
-        current_date = self.date_var.get()
-        for i, (display, value) in enumerate(date_choices):
-            if value == current_date:
-                date_combo.set(display)
-                break
-        else:
-            date_combo.set(date_choices[0][0])
-            
-        # Update date_var when selection changes
-        def on_date_change(event):
-            selected_display = date_combo.get()
-            for display, value in date_choices:
-                if display == selected_display:
-                    self.date_var.set(value)
-                    break
-        date_combo.bind('<<ComboboxSelected>>', on_date_change)
+        def on_date_write(*_):
+            value = value_by_display.get(self._date_display_var.get())
+            if value is not None:
+                self.date_var.set(value)
+        self._date_display_var.trace_add('write', on_date_write)
         
         # Time
         time_frame = ttk.Frame(dt_grid)
         time_frame.pack(side='left', fill='x', expand=True, padx=(10, 0))
         
         ttk.Label(time_frame, text="출발 시각").pack(anchor='w')
-        time_choices = [f"{h:02d}:00" for h in range(6, 24)]  # 06:00 ~ 23:00
-        time_combo = ttk.Combobox(time_frame, values=time_choices, width=10)
-        time_combo.pack(fill='x', pady=(5, 0))
-        
         # Set current time
         current_time = self.time_var.get()
-        current_hour = current_time[:2] if len(current_time) >= 2 else "12"
-        time_display = f"{current_hour}:00"
-        time_combo.set(time_display)
+        try:
+            current_hour = f"{int(current_time[:2]):02d}"
+        except ValueError:
+            # Missing or malformed saved time
+            current_hour = "12"
+        self._time_display_var = tk.StringVar(value=f"{current_hour}:00")
+        time_combo = ttk.Combobox(time_frame, textvariable=self._time_display_var, values=TIME_CHOICES,
+                                  width=10, state='readonly')
+        time_combo.pack(fill='x', pady=(5, 0))
         
-        # Update time_var when selection changes
-        def on_time_change(event):
-            selected_time = time_combo.get()
-            hour = selected_time.split(':')[0]
-            self.time_var.set(f"{hour}0000")
-        time_combo.bind('<<ComboboxSelected>>', on_time_change)
+        def on_time_write(*_):
+            value = _TIME_VALUE_BY_DISPLAY.get(self._time_display_var.get())
+            if value is not None:
+                self.time_var.set(value)
+        self._time_display_var.trace_add('write', on_time_write)
         
         # Passengers
         passengers_frame = ttk.LabelFrame(main_frame, text="👥 승객 정보", padding=15)
         passengers_frame.pack(fill='x', pady=(0, 15))
         
         # Adult (always shown)
-        adult_frame = ttk.Frame(passengers_frame)
-        adult_frame.pack(fill='x', pady=(0, 5))
-        
-        ttk.Label(adult_frame, text="성인:", width=12).pack(side='left')
-        ttk.Spinbox(adult_frame, from_=1, to=9, textvariable=self.adult_var, width=5).pack(side='left', padx=(5, 0))
+        self._make_spin_row(passengers_frame, "성인:", self.pax_vars['adult'], from_=1)
         
         # Optional passenger types based on options
         options = get_options()
-        
-        if "child" in options:
-            child_frame = ttk.Frame(passengers_frame)
-            child_frame.pack(fill='x', pady=(0, 5))
-            ttk.Label(child_frame, text="어린이:", width=12).pack(side='left')
-            ttk.Spinbox(child_frame, from_=0, to=9, textvariable=self.child_var, width=5).pack(side='left', padx=(5, 0))
-        
-        if "senior" in options:
-            senior_frame = ttk.Frame(passengers_frame)  
-            senior_frame.pack(fill='x', pady=(0, 5))
-            ttk.Label(senior_frame, text="경로우대:", width=12).pack(side='left')
-            ttk.Spinbox(senior_frame, from_=0, to=9, textvariable=self.senior_var, width=5).pack(side='left', padx=(5, 0))
+        for key, label in self._PAX_OPTIONAL:
+            if key in options:
+                self._make_spin_row(passengers_frame, label, self.pax_vars[key])
         
         # Seat preferences
         seat_frame = ttk.LabelFrame(main_frame, text="💺 좌석 선택", padding=15)
         seat_frame.pack(fill='x', pady=(0, 15))
         
-        seat_types = ["일반실 우선", "일반실만", "특실 우선", "특실만"]
-        for i, seat_type in enumerate(seat_types):
+        for seat_type in SEAT_TYPES:
             ttk.Radiobutton(seat_frame, text=seat_type, variable=self.seat_type_var, 
                           value=seat_type).pack(anchor='w', pady=2)
         
@@ -917,7 +1253,7 @@ class ReservationWindow:
         status_frame.pack(fill='both', expand=True, pady=(0, 15))
         
         self.status_text = tk.Text(status_frame, height=8, wrap='word', state='disabled',
-                                  font=('Consolas' if self.window.tk.call('tk', 'windowingsystem') == 'win32' else 'Monospace', 9))
+                                  font=MONO_FONT)
         self.status_text.pack(fill='both', expand=True)
         
         # Scrollbar for status
@@ -943,17 +1279,70 @@ class ReservationWindow:
         
         ttk.Button(button_frame, 
                   text="닫기",
-                  command=self.window.destroy).pack(side='right')
+                  command=self.close).pack(side='right')
         
-    def log_message(self, message):
-        """Add message to status display"""
-        def update():
-            self.status_text.configure(state='normal')
-            self.status_text.insert(tk.END, f"{datetime.now().strftime('%H:%M:%S')} {message}\n")
-            self.status_text.configure(state='disabled')
-            self.status_text.see(tk.END)
+    def close(self):
+        """Cancel a running booking, then destroy the window"""
+        self.is_running = False
+        if self._future is not None:
+            self._future.cancel()
+            self._future = None
+        self.window.destroy()
         
-        self.window.after(0, update)
+    def _recalc_total(self, *_):
+        try:
+            self._total_passengers = sum(var.get() for var in self.pax_vars.values())
+        except tk.TclError:
+            # A spinbox holds text that is not a number
+            self._total_passengers = None
+            
+    def _make_spin_row(self, parent, label, var, from_=0):
+        row = ttk.Frame(parent)
+        row.pack(fill='x', pady=(0, 5))
+        ttk.Label(row, text=label, width=12).pack(side='left')
+        ttk.Spinbox(row, from_=from_, to=9, textvariable=var, width=5).pack(side='left', padx=(5, 0))
+        
+    def log_message(self, message):
+        """Add message to status display (safe to call from any thread)"""
+        # Only queues the line; _poll_status writes queued lines in one widget update
+        now = int(time.time())
+        sec, stamp = self._last_ts
+        if now != sec:
+            # Reformat the timestamp at most once per second
+            stamp = time.strftime('%H:%M:%S', time.localtime(now))
+            self._last_ts = (now, stamp)
+        self._log_queue.append(f"{stamp} {message}\n")
+        
+    def _start_polling(self):
+        if not self._polling:
+            self._polling = True
+            self.window.after(_LOG_FLUSH_MS, self._poll_status)
+            
+    def _poll_status(self):
+        """Write queued lines and notice a finished booking, on the Tk thread"""
+        if not self.window.winfo_exists():
+            # Closed while a timer was pending
+            self._polling = False
+            return
+        self._flush_log()
+        if self._future is not None and self._future.done():
+            # The reservation coroutine ended on its own
+            self.stop_booking()
+        if self.is_running or self._log_queue or self._pending_saves:
+            self.window.after(_LOG_FLUSH_MS, self._poll_status)
+        else:
+            self._polling = False
+            
+    def _flush_log(self):
+        lines = []
+        while self._log_queue:
+            lines.append(self._log_queue.popleft())
+        if not lines:
+            return
+        self.status_text.configure(state='normal')
+        self.status_text.insert(tk.END, "".join(lines))
+        self.status_text.configure(state='disabled')
+        self.status_text.see(tk.END)
         
     def start_booking(self):
         """Start the reservation process"""
@@ -962,10 +1351,12 @@ class ReservationWindow:
             messagebox.showerror("입력 오류", "출발역과 도착역이 같습니다.")
             return
             
-        total_passengers = (self.adult_var.get() + self.child_var.get() + 
-                          self.senior_var.get() + self.disability1to3_var.get() + 
-                          self.disability4to6_var.get())
+        total_passengers = self._total_passengers
         
+        if total_passengers is None:
+            messagebox.showerror("입력 오류", "승객수를 숫자로 입력하세요.")
+            return
+            
         if total_passengers == 0:
             messagebox.showerror("입력 오류", "승객수는 0이 될 수 없습니다.")
             return
@@ -989,49 +1380,66 @@ class ReservationWindow:
         
         self.log_message("🚀 예매를 시작합니다...")
         self.log_message(f"🚄 {self.rail_type}: {self.departure_var.get()} → {self.arrival_var.get()}")
-        self.log_message(f"👥 승객: 성인 {self.adult_var.get()}명")
+        self.log_message(f"👥 승객: 성인 {self.pax_vars['adult'].get()}명")
         
-        # Start reservation in separate thread
-        import threading
-        thread = threading.Thread(target=self.run_reservation, daemon=True)
-        thread.start()
+        # Run the reservation coroutine on the background event loop
+        _ensure_loop()
+        self._future = asyncio.run_coroutine_threadsafe(self.run_reservation(), _LOOP)
+        self._start_polling()
         
     def stop_booking(self):
         """Stop the reservation process"""
         self.is_running = False
+        if self._future is not None:
+            # Interrupts any pending await right away
+            self._future.cancel()
+            self._future = None
         self.start_button.configure(state='normal')
         self.stop_button.configure(state='disabled')
         self.log_message("⏹️ 예매가 중지되었습니다.")
+        self._start_polling()
         
     def save_settings(self):
         """Save current form values"""
-        keyring.set_password(self.rail_type, "departure", self.departure_var.get())
-        keyring.set_password(self.rail_type, "arrival", self.arrival_var.get())
-        keyring.set_password(self.rail_type, "date", self.date_var.get())
-        keyring.set_password(self.rail_type, "time", self.time_var.get())
-        keyring.set_password(self.rail_type, "adult", str(self.adult_var.get()))
-        keyring.set_password(self.rail_type, "child", str(self.child_var.get()))
-        keyring.set_password(self.rail_type, "senior", str(self.senior_var.get()))
-        keyring.set_password(self.rail_type, "disability1to3", str(self.disability1to3_var.get()))
-        keyring.set_password(self.rail_type, "disability4to6", str(self.disability4to6_var.get()))
-        
-    def run_reservation(self):
+        # Read the Tk variables here; only the keyring write leaves the Tk thread
+        prefs = {
+            "departure": self.departure_var.get(),
+            "arrival": self.arrival_var.get(),
+            "date": self.date_var.get(),
+            "time": self.time_var.get(),
+        }
+        for key, var in self.pax_vars.items():
+            prefs[key] = str(var.get())
+        _SAVED_PREFS[self.rail_type] = prefs
+        future = _WORKER_POOL.submit(set_prefs, self.rail_type, prefs)
+        self._pending_saves.add(future)
+        future.add_done_callback(self._on_settings_saved)
+        
+    def _on_settings_saved(self, future):
+        # Usually runs on the worker thread; log_message only queues the line
+        error = future.exception()
+        if error is not None:
+            self.log_message(f"⚠️ 설정 저장 실패: {error}")
+        self._pending_saves.discard(future)
+        
+    async def run_reservation(self):
         """Run the actual reservation logic (simplified version)"""
+        loop = asyncio.get_running_loop()
         try:
             # Get login credentials
-            user_id = keyring.get_password(self.rail_type, "id")
-            password = keyring.get_password(self.rail_type, "pass")
+            creds = await loop.run_in_executor(None, get_credentials, self.rail_type) or {}
+            user_id = creds.get("id")
+            password = creds.get("pass")
             
             if not user_id or not password:
                 self.log_message("❌ 로그인 정보를 찾을 수 없습니다.")
-                self.stop_booking()
                 return
             
             self.log_message("🔐 로그인 중...")
             
-            # Login
-            rail_class = SRT if self.rail_type == "SRT" else Korail
-            rail = rail_class(user_id, password, verbose=self.debug)
+            # Login (blocking client call runs in the default executor)
+            rail = await loop.run_in_executor(
+                None, get_rail, self.rail_type, user_id, password, self.debug)
             
             self.log_message("✅ 로그인 성공!")
             
@@ -1042,51 +1450,56 @@ class ReservationWindow:
             self.log_message("💡 현재 GUI는 데모 버전입니다.")
             
             # Simulate some processing time
-            import time
-            time.sleep(2)
+            await asyncio.sleep(2)
             
             if self.is_running:
                 self.log_message("🎫 예매 기능 구현 예정 - CLI 버전을 사용해주세요!")
                 
         except Exception as e:
             self.log_message(f"❌ 오류 발생: {str(e)}")
-            
-        finally:
-            if self.is_running:
-                self.window.after(0, self.stop_booking)
 
 
 class ReservationCheckWindow:
+    SIZE = (700, 500)
+    
+    # Rows inserted per batch; more are added as the list scrolls near its end
+    ROW_BATCH = 30
+    
     def __init__(self, parent, rail_type, debug):
         self.rail_type = rail_type
         self.debug = debug
         
         self.window = tk.Toplevel(parent)
-        self.window.title(f"📋 {rail_type} 예매 확인")
-        self.window.geometry("700x500")
+        _ensure_styles(self.window)
+        self.window.title(CHECK_TITLES[rail_type])
         self.window.resizable(True, True)
         self.window.grab_set()
         
-        # Center the window
+        # Size and center the window
         self.center_window()
         
+        # All fetched rows; only the first _rows_shown are in the Treeview
+        self._all_reservations = []
+        self._rows_shown = 0
+        self._more_pending = False
+        # Most recent fetch started by load_reservations
+        self._load_future = None
+        
         self.create_interface()
         self.load_reservations()
         
     def center_window(self):
         """Center the window on parent"""
-        self.window.update_idletasks()
         parent_x = self.window.master.winfo_x()
         parent_y = self.window.master.winfo_y()
         parent_width = self.window.master.winfo_width()
         parent_height = self.window.master.winfo_height()
         
-        width = self.window.winfo_width()
-        height = self.window.winfo_height()
+        width, height = self.SIZE
         
         x = parent_x + (parent_width // 2) - (width // 2)
         y = parent_y + (parent_height // 2) - (height // 2)
-        self.window.geometry(f"+{x}+{y}")
+        self.window.geometry(f"{width}x{height}+{x}+{y}")
         
     def create_interface(self):
         # Main container
@@ -1097,7 +1510,7 @@ class ReservationCheckWindow:
         header_frame = ttk.Frame(main_frame)
         header_frame.pack(fill='x', pady=(0, 20))
         
-        rail_icon = "🚄" if self.rail_type == "SRT" else "🚅"
+        rail_icon = RAIL_ICONS[self.rail_type]
         ttk.Label(header_frame, 
                  text=f"📋 {rail_icon} {self.rail_type} 예매 내역", 
                  style='Title.TLabel').pack()
@@ -1119,9 +1532,9 @@ class ReservationCheckWindow:
         self.tree.pack(fill='both', expand=True, pady=(0, 10))
         
         # Scrollbar
-        tree_scroll = ttk.Scrollbar(list_frame, orient='vertical', command=self.tree.yview)
-        tree_scroll.pack(side='right', fill='y')
-        self.tree.configure(yscrollcommand=tree_scroll.set)
+        self.tree_scroll = ttk.Scrollbar(list_frame, orient='vertical', command=self.tree.yview)
+        self.tree_scroll.pack(side='right', fill='y')
+        self.tree.configure(yscrollcommand=self._on_tree_scroll)
         
         # Control buttons
         button_frame = ttk.Frame(main_frame)
@@ -1145,31 +1558,81 @@ class ReservationCheckWindow:
         
     def load_reservations(self):
         """Load reservation list"""
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-            
+        # Clear existing items with a single Tk command
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)
+        self._all_reservations = []
+        self._rows_shown = 0
+        
+        # Credential lookup and login run on the background event loop;
+        # _poll_load shows the result on the Tk thread
+        _ensure_loop()
+        future = asyncio.run_coroutine_threadsafe(self.fetch_reservations(), _LOOP)
+        # Only the newest request may fill the list; older ones are dropped
+        self._load_future = future
+        self.window.after(_LOGIN_POLL_MS, self._poll_load, future)
+        
+    async def fetch_reservations(self):
+        """Log in and return reservation rows, or None without saved credentials"""
+        loop = asyncio.get_running_loop()
+        # Get login credentials
+        creds = await loop.run_in_executor(None, get_credentials, self.rail_type) or {}
+        user_id = creds.get("id")
+        password = creds.get("pass")
+        
+        if not user_id or not password:
+            return None
+        
+        # Login and get reservations (blocking client call runs in the default executor)
+        rail = await loop.run_in_executor(
+            None, get_rail, self.rail_type, user_id, password, self.debug)
+        
+        # This is a placeholder - implement actual reservation retrieval
+        return [
+            ('예약완료', 'SRT-101', '수서→부산', '2024-12-25', '10:00', '1A-2'),
+            ('결제대기', 'KTX-201', '서울→대구', '2024-12-26', '14:30', '2B-1'),
+        ]
+        
+    def _poll_load(self, future):
+        if not self.window.winfo_exists() or future is not self._load_future:
+            return
+        if not future.done():
+            self.window.after(_LOGIN_POLL_MS, self._poll_load, future)
+            return
         try:
-            # Get login credentials
-            user_id = keyring.get_password(self.rail_type, "id")
-            password = keyring.get_password(self.rail_type, "pass")
-            
-            if not user_id or not password:
-                messagebox.showerror("로그인 오류", "로그인 정보를 찾을 수 없습니다.")
-                return
-            
-            # Login and get reservations
-            rail_class = SRT if self.rail_type == "SRT" else Korail
-            rail = rail_class(user_id, password, verbose=self.debug)
-            
-            # This is a placeholder - implement actual reservation retrieval
-            self.tree.insert('', 'end', values=('예약완료', 'SRT-101', '수서→부산', '2024-12-25', '10:00', '1A-2'))
-            self.tree.insert('', 'end', values=('결제대기', 'KTX-201', '서울→대구', '2024-12-26', '14:30', '2B-1'))
-            
-            messagebox.showinfo("안내", "💡 실제 예매 내역 조회는 CLI 버전에서 완전히 구현됩니다.\n현재는 데모 데이터를 표시합니다.")
-            
+            rows = future.result()
         except Exception as e:
             messagebox.showerror("오류", f"예매 내역 조회 실패: {str(e)}")
+            return
+        
+        if rows is None:
+            messagebox.showerror("로그인 오류", "로그인 정보를 찾을 수 없습니다.")
+            return
+        
+        self._set_rows(rows)
+        messagebox.showinfo("안내", "💡 실제 예매 내역 조회는 CLI 버전에서 완전히 구현됩니다.\n현재는 데모 데이터를 표시합니다.")
+            
+    def _set_rows(self, rows):
+        """Replace the backing row list and show its first batch"""
+        self._all_reservations = rows
+        self._rows_shown = 0
+        self._insert_more_rows()
+        
+    def _insert_more_rows(self):
+        self._more_pending = False
+        end = min(self._rows_shown + self.ROW_BATCH, len(self._all_reservations))
+        for row in self._all_reservations[self._rows_shown:end]:
+            self.tree.insert('', 'end', values=row)
+        self._rows_shown = end
+        
+    def _on_tree_scroll(self, first, last):
+        self.tree_scroll.set(first, last)
+        # Add the next batch once the view nears the last inserted row
+        if (float(last) >= 0.9 and not self._more_pending
+                and self._rows_shown < len(self._all_reservations)):
+            self._more_pending = True
+            self.window.after_idle(self._insert_more_rows)
             
     def pay_reservation(self):
         """Pay for selected reservation"""
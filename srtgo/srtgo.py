@@ -11,6 +11,7 @@ from typing import Awaitable, Callable, List, Optional, Tuple, Union
 
 import asyncio
 import click
+import json
 import inquirer
 import keyring
 import telegram
@@ -120,6 +121,19 @@ DEFAULT_STATIONS = {
     "KTX": ["서울", "대전", "동대구", "부산"],
 }
 
+# 예매 기본값 항목 (keyring "prefs" 항목에 JSON으로 저장)
+PREF_KEYS = (
+    "departure",
+    "arrival",
+    "date",
+    "time",
+    "adult",
+    "child",
+    "senior",
+    "disability1to3",
+    "disability4to6",
+)
+
 # 예약 간격 (평균 간격 (초) = SHAPE * SCALE): gamma distribution (1.25 +/- 0.25 s)
 RESERVE_INTERVAL_SHAPE = 4
 RESERVE_INTERVAL_SCALE = 0.25
@@ -258,10 +272,33 @@ def get_station(rail_type: RailType) -> Tuple[List[str], List[int]]:
     if not station_key:
         return stations, DEFAULT_STATIONS[rail_type]
 
-    valid_keys = [x for x in station_key.split(",")]
+    valid_keys = station_key.split(",")
     return stations, valid_keys
 
 
+def get_prefs(rail_type: RailType) -> dict:
+    """저장된 예매 기본값 (단일 항목 우선, 없으면 항목별 키)"""
+    stored = {}
+    blob = keyring.get_password(rail_type, "prefs")
+    if blob:
+        try:
+            stored = json.loads(blob)
+        except JSONDecodeError:
+            stored = {}
+    if not stored:
+        return {key: keyring.get_password(rail_type, key) for key in PREF_KEYS}
+    return {key: stored.get(key) for key in PREF_KEYS}
+
+
+def set_prefs(rail_type: RailType, prefs: dict) -> None:
+    """예매 기본값을 한 번의 keyring 쓰기로 저장"""
+    keyring.set_password(
+        rail_type,
+        "prefs",
+        json.dumps(prefs, ensure_ascii=False, separators=(",", ":")),
+    )
+
+
 def set_options():
     default_options = get_options()
     choices = inquirer.prompt(
@@ -622,17 +659,17 @@ def reserve(rail_type="SRT", debug=False):
     today = now.strftime("%Y%m%d")
     this_time = now.strftime("%H%M%S")
 
+    prefs = get_prefs(rail_type)
     defaults = {
-        "departure": keyring.get_password(rail_type, "departure")
-        or ("수서" if is_srt else "서울"),
-        "arrival": keyring.get_password(rail_type, "arrival") or "동대구",
-        "date": keyring.get_password(rail_type, "date") or today,
-        "time": keyring.get_password(rail_type, "time") or "120000",
-        "adult": int(keyring.get_password(rail_type, "adult") or 1),
-        "child": int(keyring.get_password(rail_type, "child") or 0),
-        "senior": int(keyring.get_password(rail_type, "senior") or 0),
-        "disability1to3": int(keyring.get_password(rail_type, "disability1to3") or 0),
-        "disability4to6": int(keyring.get_password(rail_type, "disability4to6") or 0),
+        "departure": prefs["departure"] or ("수서" if is_srt else "서울"),
+        "arrival": prefs["arrival"] or "동대구",
+        "date": prefs["date"] or today,
+        "time": prefs["time"] or "120000",
+        "adult": int(prefs["adult"] or 1),
+        "child": int(prefs["child"] or 0),
+        "senior": int(prefs["senior"] or 0),
+        "disability1to3": int(prefs["disability1to3"] or 0),
+        "disability4to6": int(prefs["disability4to6"] or 0),
     }
 
     # Set default stations if departure equals arrival
@@ -740,8 +777,8 @@ def reserve(rail_type="SRT", debug=False):
         return
 
     # Save preferences
-    for key, value in info.items():
-        keyring.set_password(rail_type, key, str(value))
+    prefs.update((key, str(value)) for key, value in info.items())
+    set_prefs(rail_type, prefs)
 
     # Adjust time if needed
     if info["date"] == today and int(info["time"]) < int(this_time):